@@ -73,12 +73,19 @@ class Config:
                 f"Please copy config/.env.example to config/.env and fill in your values."
             )
 
+    # Set once create_directories() has run, so repeated calls are free
+    _directories_created = False
+
     @classmethod
     def create_directories(cls):
-        """Creates necessary directories if they don't exist."""
+        """
+        Creates necessary directories if they don't exist.
+
+        Called by the code that writes to DATA_DIR / LOG_DIR rather than on
+        import, so importing config stays free of filesystem work.
+        """
+        if cls._directories_created:
+            return
         cls.LOG_DIR.mkdir(parents=True, exist_ok=True)
         cls.DATA_DIR.mkdir(parents=True, exist_ok=True)
-
-
-# Create directories on import
-Config.create_directories()
+        cls._directories_created = True
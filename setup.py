@@ -3,6 +3,7 @@ Quick Setup Script
 Run this after installing requirements to set up the project.
 """
 
+import importlib.util
 import os
 import sys
 from pathlib import Path
@@ -51,19 +52,15 @@ def main():
 
     print()
 
-    # Step 4: Test imports
+    # Step 4: Check that packages are installed
+    # (find_spec only locates each package - it doesn't import it, which is much faster)
     print("✓ Testing imports...")
-    try:
-        import tweepy
-        import textblob
-        import vaderSentiment
-        import pandas
-        import matplotlib
-        import requests
-        import bs4
+    required_packages = ['tweepy', 'textblob', 'vaderSentiment', 'pandas', 'matplotlib', 'requests', 'bs4']
+    missing = [name for name in required_packages if importlib.util.find_spec(name) is None]
+    if not missing:
         print("  All required packages are installed")
-    except ImportError as e:
-        print(f"  ⚠️  Warning: Missing package: {e}")
+    else:
+        print(f"  ⚠️  Warning: Missing package(s): {', '.join(missing)}")
         print("  Run: pip install -r requirements.txt")
 
     print()
@@ -4,16 +4,139 @@ This module analyzes text sentiment using multiple methods and provides
 a unified sentiment score on a scale from -1 (very negative) to +1 (very positive).
 """
 
-from textblob import TextBlob
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+# TextBlob and VADER are imported when first needed (see _get_vader and
+# analyze_with_textblob) - importing TextBlob pulls in NLTK, which is slow
 import logging
-from typing import Dict, List
+from typing import Dict, List, NamedTuple, Optional
+import functools
+import os
 import re
+import string
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# NumPy speeds up batch aggregation but is not part of requirements-minimal.txt
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used by clean_text (compiled once at import time).
+# Each is a literal prefix followed by a single character class, so the
+# stdlib engine matches in linear time without backtracking.
+_URL_RE = re.compile(r'http\S+|www\S+')
+_MENTION_RE = re.compile(r'@\w+')
+_WS_RE = re.compile(r'\s+')
+
+# Word pieces checked against the lexicons by the neutral fast path in
+# _analyze_impl - TextBlob's tokenizer splits words glued together by
+# punctuation, so "great,awesome" or "latest'.top" must still be caught
+_WORD_PIECE_RE = re.compile(r"[a-z0-9'*-]+")
+_ALNUM_RE = re.compile(r"[a-z0-9]+")
+
+# Texts made only of these characters cannot contain an emoticon or the "(!)"
+# sarcasm marker that is missing from the lexicons (see _is_neutral_text)
+_PLAIN_TEXT_RE = re.compile(r"[A-Za-z0-9\s'.,!?$%&/-]*")
+
+
+
+class SentimentResult(NamedTuple):
+    """
+    Scores for one analyzed text (returned by SentimentAnalyzer.analyze).
+
+    A NamedTuple is much smaller than a dictionary and its fields are read as
+    attributes, e.g. result.sentiment_score. Use to_dict() where a plain
+    dictionary is needed (for example when storing results in the database).
+    """
+    sentiment_score: float   # Combined score from -1 (negative) to 1 (positive)
+    textblob_score: float    # TextBlob polarity score
+    vader_score: float       # VADER compound score
+    confidence: float        # Confidence in the analysis (0 to 1)
+    subjectivity: float      # How subjective/opinionated the text is (0 to 1)
+    vader_positive: float
+    vader_negative: float
+    vader_neutral: float
+
+    def to_dict(self) -> Dict[str, float]:
+        """Convert the result to a dictionary keyed by field name."""
+        return dict(zip(self._fields, self))
+
+
+# Names of the SentimentResult fields, in order
+RESULT_FIELDS = SentimentResult._fields
+
+# Result for texts that are empty after cleaning
+_EMPTY_RESULT = SentimentResult(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+# Result for texts with no sentiment-bearing words (both scores 0, full
+# agreement, 100% neutral - the same values the full analysis produces)
+_NEUTRAL_RESULT = SentimentResult(0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
+
+# Number of distinct texts whose scores are remembered by each analyzer
+ANALYZE_CACHE_SIZE = 65536
+
+# Batches up to this size are analyzed serially - starting worker processes
+# costs more than it saves for small inputs
+PARALLEL_BATCH_THRESHOLD = 64
+
+
+@functools.lru_cache(maxsize=None)
+def _get_vader():
+    """
+    Import VADER and create the analyzer used by SentimentAnalyzer.
+
+    Loading VADER's lexicon takes a while and polarity_scores keeps no state
+    between calls, so one analyzer is created per process and shared by every
+    SentimentAnalyzer instance.
+
+    Returns:
+        VADER analyzer with a fast path for plain-ASCII text
+    """
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer, SentiText, BOOSTER_DICT
+
+    class _FastVader(SentimentIntensityAnalyzer):
+        """
+        VADER analyzer with a fast path for plain-ASCII text.
+
+        VADER's polarity_scores starts by walking the text one character at a time
+        to replace emojis with their text descriptions. Every emoji in VADER's table
+        is non-ASCII, so for ASCII text (most tweets once URLs are stripped) that
+        loop can never change anything and is skipped. Scoring itself is unchanged.
+        """
+
+        def polarity_scores(self, text):
+            if not text.isascii():
+                return super().polarity_scores(text)
+
+            # Same steps as SentimentIntensityAnalyzer.polarity_scores (vaderSentiment 3.3.2)
+            # minus the emoji replacement loop
+            text = text.strip()
+            sentitext = SentiText(text)
+
+            sentiments = []
+            words_and_emoticons = sentitext.words_and_emoticons
+            last_index = len(words_and_emoticons) - 1
+            for i, item in enumerate(words_and_emoticons):
+                item_lower = item.lower()
+                # Booster words and "kind of" only modify their neighbours
+                if item_lower in BOOSTER_DICT or (
+                        i < last_index and item_lower == "kind" and
+                        words_and_emoticons[i + 1].lower() == "of"):
+                    sentiments.append(0)
+                    continue
+
+                sentiments = self.sentiment_valence(0, sentitext, item, i, sentiments)
+
+            sentiments = self._but_check(words_and_emoticons, sentiments)
+
+            return self.score_valence(sentiments, text)
+
+    return _FastVader()
+
 
 class SentimentAnalyzer:
     """
@@ -28,8 +151,22 @@ class SentimentAnalyzer:
 
     def __init__(self):
         """Initialize the sentiment analyzer with both TextBlob and VADER."""
-        # VADER is particularly good for social media text
-        self.vader = SentimentIntensityAnalyzer()
+        # VADER is particularly good for social media text (shared, see _get_vader)
+        self.vader = _get_vader()
+
+        # TextBlob's sentiment scorer (imported on first use)
+        self._pattern_sentiment = None
+        self._lexicon_words = None
+        self._plain_emoticons = ()
+
+        # Memoize scores by input text - retweets and copy-pasted posts repeat a lot.
+        # lru_cache is thread-safe and the cached tuples are immutable.
+        self._analyze_cached = functools.lru_cache(maxsize=ANALYZE_CACHE_SIZE)(self._analyze_impl)
+
+        # Process pool for large batches (created on first use, see analyze_batch)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_workers = 0
+
         logger.info("Sentiment analyzer initialized")
 
     def clean_text(self, text: str) -> str:
@@ -44,17 +181,16 @@ class SentimentAnalyzer:
 
         This removes URLs, extra whitespace, and other noise.
         """
-        # Remove URLs
-        text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
+        # Remove URLs first, then @mentions - "@userhttp://x.co" must lose
+        # the URL before the mention, or "@\w+" would eat the "http" prefix
+        text = _URL_RE.sub('', text)
+        text = _MENTION_RE.sub('', text)
 
-        # Remove @mentions and #hashtags (but keep the text after #)
-        text = re.sub(r'@\w+', '', text)
-        text = re.sub(r'#', '', text)
+        # Remove # from hashtags (but keep the text after #)
+        text = text.replace('#', '')
 
         # Remove extra whitespace
-        text = ' '.join(text.split())
-
-        return text.strip()
+        return _WS_RE.sub(' ', text).strip()
 
     def analyze_with_textblob(self, text: str) -> Dict[str, float]:
         """
@@ -68,12 +204,21 @@ class SentimentAnalyzer:
 
         Polarity: -1 = very negative, 0 = neutral, 1 = very positive
         Subjectivity: 0 = very objective, 1 = very subjective/opinionated
+
+        This calls TextBlob's pattern-based lexicon scorer directly, which gives
+        the same result as TextBlob(text).sentiment without building a TextBlob
+        object (and its tokenizer chain) for every text.
         """
+        if self._pattern_sentiment is None:
+            # TextBlob's default PatternAnalyzer is a thin wrapper around this lexicon scorer
+            from textblob.en import sentiment
+            self._pattern_sentiment = sentiment
+
         try:
-            blob = TextBlob(text)
+            polarity, subjectivity = self._pattern_sentiment(text)
             return {
-                'polarity': blob.sentiment.polarity,
-                'subjectivity': blob.sentiment.subjectivity
+                'polarity': polarity,
+                'subjectivity': subjectivity
             }
         except Exception as e:
             logger.error(f"TextBlob analysis error: {e}")
@@ -108,7 +253,7 @@ class SentimentAnalyzer:
             logger.error(f"VADER analysis error: {e}")
             return {'compound': 0.0, 'positive': 0.0, 'negative': 0.0, 'neutral': 1.0}
 
-    def analyze(self, text: str) -> Dict[str, float]:
+    def analyze(self, text: str) -> SentimentResult:
         """
         Perform comprehensive sentiment analysis.
 
@@ -116,7 +261,7 @@ class SentimentAnalyzer:
             text: Text to analyze
 
         Returns:
-            Dictionary containing:
+            SentimentResult containing:
             - sentiment_score: Combined score from -1 (negative) to 1 (positive)
             - textblob_score: TextBlob polarity score
             - vader_score: VADER compound score
@@ -126,19 +271,86 @@ class SentimentAnalyzer:
         The final sentiment_score is a weighted average:
         - VADER gets 60% weight (better for social media)
         - TextBlob gets 40% weight (good for general text)
+
+        Results are memoized per analyzer (see ANALYZE_CACHE_SIZE), so duplicate
+        texts such as copied tweets are only scored once.
+        """
+        return self._analyze_cached(text)
+
+    def _get_lexicon_words(self) -> set:
+        """
+        Get every word and emoticon that TextBlob or VADER can score.
+
+        Returns:
+            Set of lowercase lexicon entries (built on first use)
+        """
+        if self._lexicon_words is None:
+            from textblob._text import EMOTICONS
+            if self._pattern_sentiment is None:
+                from textblob.en import sentiment
+                self._pattern_sentiment = sentiment
+
+            words = {word.lower() for word in self.vader.lexicon}
+            words.update(self._pattern_sentiment.keys())
+            for emoticons in EMOTICONS.values():
+                words.update(emoticon.lower() for emoticon in emoticons)
+            self._lexicon_words = words
+
+            # Emoticons like "x-d" or "j/k" are made of plain characters and can
+            # hide inside a longer token, so they are searched for as substrings
+            self._plain_emoticons = tuple(
+                word for word in words
+                if len(word) <= 5 and not word.isalnum() and _PLAIN_TEXT_RE.fullmatch(word)
+            )
+
+        return self._lexicon_words
+
+    def _is_neutral_text(self, cleaned_text: str) -> bool:
+        """
+        Check whether neither analyzer can find any sentiment in a text.
+
+        Args:
+            cleaned_text: Text returned by clean_text
+
+        Returns:
+            True if no word, word piece or emoticon in the text is in a lexicon
+        """
+        if not cleaned_text.isascii() or not _PLAIN_TEXT_RE.fullmatch(cleaned_text):
+            return False
+
+        lexicon = self._get_lexicon_words()
+        lowered = cleaned_text.lower()
+        for token in lowered.split():
+            if token in lexicon or token.strip(string.punctuation) in lexicon:
+                return False
+
+        if any(piece in lexicon for piece in _WORD_PIECE_RE.findall(lowered)):
+            return False
+        if any(emoticon in lowered for emoticon in self._plain_emoticons):
+            return False
+        return not any(piece in lexicon for piece in _ALNUM_RE.findall(lowered))
+
+    def _analyze_impl(self, text: str) -> SentimentResult:
+        """
+        Score a text (the uncached part of analyze).
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            SentimentResult (immutable, so it can be stored in the LRU cache)
         """
         # Clean the text first
         cleaned_text = self.clean_text(text)
 
         if not cleaned_text:
             logger.warning("Empty text after cleaning")
-            return {
-                'sentiment_score': 0.0,
-                'textblob_score': 0.0,
-                'vader_score': 0.0,
-                'confidence': 0.0,
-                'subjectivity': 0.0
-            }
+            return _EMPTY_RESULT
+
+        # Link-only posts and retweet skeletons contain no sentiment-bearing
+        # words at all, so both analyzers would score them 0.0 - skip them
+        if self._is_neutral_text(cleaned_text):
+            return _NEUTRAL_RESULT
 
         # Get scores from both analyzers
         textblob_result = self.analyze_with_textblob(cleaned_text)
@@ -158,32 +370,73 @@ class SentimentAnalyzer:
         agreement = 1 - abs(vader_result['compound'] - textblob_result['polarity']) / 2
         confidence = agreement
 
-        return {
-            'sentiment_score': combined_score,
-            'textblob_score': textblob_result['polarity'],
-            'vader_score': vader_result['compound'],
-            'confidence': confidence,
-            'subjectivity': textblob_result['subjectivity'],
-            'vader_positive': vader_result.get('pos', vader_result.get('positive', 0.0)),
-            'vader_negative': vader_result.get('neg', vader_result.get('negative', 0.0)),
-            'vader_neutral': vader_result.get('neu', vader_result.get('neutral', 0.0))
-        }
+        return SentimentResult(
+            combined_score,
+            textblob_result['polarity'],
+            vader_result['compound'],
+            confidence,
+            textblob_result['subjectivity'],
+            vader_result.get('pos', vader_result.get('positive', 0.0)),
+            vader_result.get('neg', vader_result.get('negative', 0.0)),
+            vader_result.get('neu', vader_result.get('neutral', 0.0))
+        )
 
-    def analyze_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+    def analyze_batch(self, texts: List[str], workers: Optional[int] = None) -> List[SentimentResult]:
         """
         Analyze sentiment for multiple texts.
 
         Args:
             texts: List of text strings to analyze
+            workers: Number of worker processes for large batches
+                     (default: number of CPU cores)
 
         Returns:
-            List of sentiment analysis results
+            List of sentiment analysis results (in the same order as texts)
+
+        VADER and TextBlob are pure CPU work, so batches larger than
+        PARALLEL_BATCH_THRESHOLD are spread across a process pool.
+        Smaller batches run serially to avoid process start-up overhead.
 
         Example:
             tweets = ["Great stock!", "Market crash!", "Neutral news"]
             results = analyzer.analyze_batch(tweets)
         """
-        return [self.analyze(text) for text in texts]
+        workers = workers or os.cpu_count() or 1
+
+        if len(texts) <= PARALLEL_BATCH_THRESHOLD or workers == 1:
+            return [self.analyze(text) for text in texts]
+
+        try:
+            executor = self._get_executor(workers)
+            chunksize = max(1, len(texts) // (workers * 4))
+            return list(executor.map(_analyze_worker, texts, chunksize=chunksize))
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"Parallel analysis failed, falling back to serial: {e}")
+            self.close()
+            return [self.analyze(text) for text in texts]
+
+    def _get_executor(self, workers: int) -> ProcessPoolExecutor:
+        """
+        Get the cached process pool, recreating it if the worker count changed.
+
+        Args:
+            workers: Number of worker processes
+
+        Returns:
+            ProcessPoolExecutor instance
+        """
+        if self._executor is None or self._executor_workers != workers:
+            self.close()
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+            self._executor_workers = workers
+        return self._executor
+
+    def close(self):
+        """Shut down the worker process pool (if one was started)."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._executor_workers = 0
 
     def get_overall_sentiment(self, texts: List[str]) -> Dict[str, float]:
         """
@@ -212,15 +465,26 @@ class SentimentAnalyzer:
 
         # Calculate statistics
         total = len(results)
-        average_sentiment = sum(r['sentiment_score'] for r in results) / total
 
         # Count positive, negative, and neutral
         # Using thresholds: > 0.05 = positive, < -0.05 = negative, else neutral
         positive_threshold = 0.05
         negative_threshold = -0.05
 
-        positive_count = sum(1 for r in results if r['sentiment_score'] > positive_threshold)
-        negative_count = sum(1 for r in results if r['sentiment_score'] < negative_threshold)
+        if np is not None:
+            # Copy the scores into one contiguous array so the mean and both
+            # counts are vectorized passes instead of Python generator loops
+            scores = np.fromiter(
+                (r.sentiment_score for r in results), dtype=np.float64, count=total
+            )
+            average_sentiment = float(scores.mean())
+            positive_count = int((scores > positive_threshold).sum())
+            negative_count = int((scores < negative_threshold).sum())
+        else:
+            average_sentiment = sum(r.sentiment_score for r in results) / total
+            positive_count = sum(1 for r in results if r.sentiment_score > positive_threshold)
+            negative_count = sum(1 for r in results if r.sentiment_score < negative_threshold)
+
         neutral_count = total - positive_count - negative_count
 
         return {
@@ -256,6 +520,19 @@ class SentimentAnalyzer:
             return "Very Negative"
 
 
+# Analyzer used inside each worker process of analyze_batch's process pool.
+# Created lazily so every worker builds its own VADER/TextBlob state once.
+_worker_analyzer: Optional[SentimentAnalyzer] = None
+
+
+def _analyze_worker(text: str) -> SentimentResult:
+    """Analyze one text inside a worker process (must be a module-level function to be picklable)."""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = SentimentAnalyzer()
+    return _worker_analyzer.analyze(text)
+
+
 # Example usage and testing
 if __name__ == "__main__":
     """
@@ -279,13 +556,13 @@ if __name__ == "__main__":
     print("-" * 80)
     for text in test_texts:
         result = analyzer.analyze(text)
-        classification = analyzer.classify_sentiment(result['sentiment_score'])
+        classification = analyzer.classify_sentiment(result.sentiment_score)
 
         print(f"\nText: {text}")
-        print(f"Sentiment Score: {result['sentiment_score']:.3f}")
+        print(f"Sentiment Score: {result.sentiment_score:.3f}")
         print(f"Classification: {classification}")
-        print(f"Confidence: {result['confidence']:.3f}")
-        print(f"Subjectivity: {result['subjectivity']:.3f}")
+        print(f"Confidence: {result.confidence:.3f}")
+        print(f"Subjectivity: {result.subjectivity:.3f}")
 
     # Test overall sentiment
     print("\n" + "=" * 80)
@@ -12,22 +12,48 @@ Get your free API key at: https://site.financialmodelingprep.com/developer/docs
 Free tier: 250 requests/day
 """
 
+import re
 import requests
+import sys
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-from datetime import datetime
-from typing import List, Dict, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from typing import List, Dict, Optional, Tuple
 import logging
 
+# orjson parses JSON several times faster than the standard library (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import our configuration
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from config.config import Config
+# The project root is only added to sys.path when this file is run directly
+# as a script; normal imports (e.g. from src/main.py) leave sys.path alone.
+try:
+    from config.config import Config
+except ImportError:
+    from pathlib import Path
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+    from config.config import Config
+from src.database.response_cache import ResponseCache
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# How long cached responses stay valid (in seconds)
+# Holder data comes from quarterly 13F filings, insider trades change more often
+HOLDERS_CACHE_TTL = 90 * 24 * 60 * 60  # 90 days
+INSIDER_CACHE_TTL = 7 * 24 * 60 * 60   # 7 days
+
+# Insider trade dates must look exactly like this (YYYY-MM-DD). Anything
+# else is skipped, whether or not NumPy is installed.
+_TRADE_DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
 
 class FMPCollector:
     """
@@ -40,12 +66,20 @@ class FMPCollector:
     - Stock ownership changes over time
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    # Endpoint paths (filled in with the ticker symbol where needed)
+    INSTITUTIONAL_HOLDER_ENDPOINT = '/institutional-holder/{}'
+    MUTUAL_FUND_HOLDER_ENDPOINT = '/mutual-fund-holder/{}'
+    INSIDER_TRADING_ENDPOINT = '/v4/insider-trading'
+    OWNERSHIP_ENDPOINT = '/v4/institutional-ownership/symbol-ownership'
+
+    def __init__(self, api_key: Optional[str] = None, use_cache: bool = True):
         """
         Initialize the FMP collector.
 
         Args:
             api_key: FMP API key (uses config if not provided)
+            use_cache: If True, responses are cached on disk (data/fmp_cache.db)
+                       so repeated requests don't use up the daily quota
         """
         self.api_key = api_key or Config.FMP_API_KEY
         self.base_url = 'https://financialmodelingprep.com/api/v3'
@@ -54,38 +88,67 @@ class FMPCollector:
         # Rate limiting for free tier (250 requests/day)
         self.requests_per_day = 250
         self.min_request_interval = 0.5  # 0.5 seconds between requests
-        self.last_request_time = 0
+        self.last_request_time = 0.0  # time.monotonic() of the last request
+        # Makes the rate limiter safe when requests come from several threads
+        self._rate_limit_lock = threading.Lock()
+
+        # Reuse one HTTP session so the TCP/TLS connection to FMP is kept alive
+        # between calls instead of doing a new handshake for every request
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        ))
+        # The API key is sent with every request
+        self.session.params = {'apikey': self.api_key}
+
+        # Persistent response cache (shared across runs)
+        self.cache = ResponseCache(Config.DATA_DIR / 'fmp_cache.db') if use_cache else None
 
         logger.info("FMP API collector initialized")
 
     def _rate_limit(self):
-        """Enforce rate limiting between API calls."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
-            time.sleep(sleep_time)
-
-        self.last_request_time = time.time()
+        """
+        Enforce rate limiting between API calls (thread-safe).
 
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        Uses the monotonic clock, which (unlike time.time) never jumps when the
+        system clock is adjusted, so the interval can't be skipped by accident.
+        """
+        with self._rate_limit_lock:
+            wait = self.min_request_interval - (time.monotonic() - self.last_request_time)
+            if wait > 0:
+                time.sleep(wait)
+
+            self.last_request_time = time.monotonic()
+
+    def _make_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        cache_ttl: Optional[float] = None
+    ) -> Optional[Dict]:
         """
         Make a rate-limited request to FMP API.
 
         Args:
             endpoint: API endpoint (e.g., '/institutional-holder/AAPL')
-            params: Optional query parameters
+            params: Optional query parameters (the API key is added by the session)
+            cache_ttl: If set, responses are kept in the disk cache for this many
+                       seconds and served from there until they expire
 
         Returns:
             JSON response or None if request failed
         """
-        self._rate_limit()
+        use_cache = cache_ttl is not None and self.cache is not None
+        if use_cache:
+            cache_key = ResponseCache.make_key(endpoint, sorted((params or {}).items()))
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Using cached response for {endpoint}")
+                return cached
 
-        # Add API key to params
-        if params is None:
-            params = {}
-        params['apikey'] = self.api_key
+        self._rate_limit()
 
         # Determine base URL
         if endpoint.startswith('/v4/'):
@@ -94,12 +157,28 @@ class FMPCollector:
             url = self.base_url + endpoint
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            return response.json()
+            data = orjson.loads(response.content) if orjson else response.json()
         except requests.exceptions.RequestException as e:
             logger.error(f"FMP API request failed: {e}")
             return None
+        except ValueError as e:
+            logger.error(f"FMP API returned invalid JSON: {e}")
+            return None
+
+        # FMP reports problems like a bad key or a used-up quota as
+        # {"Error Message": "..."} with HTTP 200
+        if isinstance(data, dict) and 'Error Message' in data:
+            logger.error(f"FMP API error for {endpoint}: {data['Error Message']}")
+            return None
+
+        # Only cache real data - the endpoints we cache return a non-empty
+        # list - so an empty or unexpected response is retried next time
+        if use_cache and isinstance(data, list) and data:
+            self.cache.set(cache_key, data, cache_ttl)
+
+        return data
 
     def get_institutional_holders(self, ticker: str) -> List[Dict]:
         """
@@ -128,8 +207,10 @@ class FMPCollector:
         """
         logger.info(f"Fetching institutional holders for {ticker}")
 
-        endpoint = f'/institutional-holder/{ticker.upper()}'
-        data = self._make_request(endpoint)
+        # Upper-case once; sys.intern makes every record share one string object
+        symbol = sys.intern(ticker.upper())
+        endpoint = self.INSTITUTIONAL_HOLDER_ENDPOINT.format(symbol)
+        data = self._make_request(endpoint, cache_ttl=HOLDERS_CACHE_TTL)
 
         if not data:
             logger.warning(f"No institutional holder data found for {ticker}")
@@ -137,7 +218,7 @@ class FMPCollector:
 
         # Add ticker to each record
         for holder in data:
-            holder['ticker'] = ticker.upper()
+            holder['ticker'] = symbol
 
         logger.info(f"Retrieved {len(data)} institutional holders for {ticker}")
         return data
@@ -163,8 +244,10 @@ class FMPCollector:
         """
         logger.info(f"Fetching mutual fund holders for {ticker}")
 
-        endpoint = f'/mutual-fund-holder/{ticker.upper()}'
-        data = self._make_request(endpoint)
+        # Upper-case once; sys.intern makes every record share one string object
+        symbol = sys.intern(ticker.upper())
+        endpoint = self.MUTUAL_FUND_HOLDER_ENDPOINT.format(symbol)
+        data = self._make_request(endpoint, cache_ttl=HOLDERS_CACHE_TTL)
 
         if not data:
             logger.warning(f"No mutual fund holder data found for {ticker}")
@@ -172,7 +255,7 @@ class FMPCollector:
 
         # Add ticker to each record
         for holder in data:
-            holder['ticker'] = ticker.upper()
+            holder['ticker'] = symbol
 
         logger.info(f"Retrieved {len(data)} mutual fund holders for {ticker}")
         return data
@@ -204,9 +287,8 @@ class FMPCollector:
         """
         logger.info(f"Fetching insider trades for {ticker}")
 
-        endpoint = f'/v4/insider-trading'
         params = {'symbol': ticker.upper()}
-        data = self._make_request(endpoint, params)
+        data = self._make_request(self.INSIDER_TRADING_ENDPOINT, params, cache_ttl=INSIDER_CACHE_TTL)
 
         if not data:
             logger.warning(f"No insider trading data found for {ticker}")
@@ -232,9 +314,8 @@ class FMPCollector:
         """
         logger.info(f"Fetching stock ownership for {ticker}")
 
-        endpoint = f'/v4/institutional-ownership/symbol-ownership'
         params = {'symbol': ticker.upper()}
-        data = self._make_request(endpoint, params)
+        data = self._make_request(self.OWNERSHIP_ENDPOINT, params, cache_ttl=HOLDERS_CACHE_TTL)
 
         if not data or len(data) == 0:
             logger.warning(f"No ownership data found for {ticker}")
@@ -243,6 +324,51 @@ class FMPCollector:
         # Return the most recent data
         return data[0] if isinstance(data, list) else data
 
+    def fetch_all(self, tickers: List[str], max_workers: int = 4) -> Dict[str, Dict]:
+        """
+        Fetch holders, insider trades and ownership for many tickers concurrently.
+
+        Requests still respect the rate limit (one request starts every
+        min_request_interval), but their network round-trips overlap instead
+        of running one after another.
+
+        Args:
+            tickers: List of stock ticker symbols
+            max_workers: Maximum number of requests in flight at once
+
+        Returns:
+            Dictionary mapping ticker to a dictionary with:
+            - institutional_holders: List of institutional holders
+            - mutual_fund_holders: List of mutual fund holders
+            - insider_trades: List of insider trades
+            - ownership: Stock ownership dictionary
+
+        Example:
+            data = collector.fetch_all(["AAPL", "MSFT"])
+            apple_holders = data["AAPL"]["institutional_holders"]
+        """
+        fetchers = {
+            'institutional_holders': self.get_institutional_holders,
+            'mutual_fund_holders': self.get_mutual_fund_holders,
+            'insider_trades': self.get_insider_trades,
+            'ownership': self.get_stock_ownership,
+        }
+
+        symbols = [ticker.upper() for ticker in tickers]
+        results = {symbol: {} for symbol in symbols}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(fetch, symbol): (symbol, name)
+                for symbol in symbols
+                for name, fetch in fetchers.items()
+            }
+            for future in as_completed(futures):
+                ticker, name = futures[future]
+                results[ticker][name] = future.result()
+
+        return results
+
     def analyze_institutional_sentiment(self, ticker: str) -> Dict:
         """
         Analyze institutional sentiment based on ownership changes.
@@ -268,9 +394,12 @@ class FMPCollector:
                 'description': 'No institutional holder data available'
             }
 
-        # Count holders with increasing vs decreasing positions
-        increasing = sum(1 for h in holders if h.get('change', 0) > 0)
-        decreasing = sum(1 for h in holders if h.get('change', 0) < 0)
+        # Count holders with increasing vs decreasing positions (in a single pass)
+        increasing = decreasing = 0
+        for holder in holders:
+            change = holder.get('change') or 0
+            increasing += change > 0
+            decreasing += change < 0
         total = len(holders)
 
         # Calculate sentiment score
@@ -296,6 +425,35 @@ class FMPCollector:
             'description': f'{increasing} institutions increased, {decreasing} decreased positions'
         }
 
+    @staticmethod
+    def _count_recent_trades(trades: List[Dict], cutoff_date: date) -> Tuple[int, int, int]:
+        """
+        Count recent insider trades, buys and sells in a single pass.
+
+        Args:
+            trades: Insider trades from get_insider_trades
+            cutoff_date: Oldest transaction date to include
+
+        Returns:
+            Tuple of (recent trades, buys, sells)
+        """
+        recent = buys = sells = 0
+        for trade in trades:
+            value = trade.get('transactionDate')
+            if not isinstance(value, str) or not _TRADE_DATE_RE.fullmatch(value):
+                continue  # Skip trades with a missing or malformed date
+            try:
+                # FMP dates are YYYY-MM-DD; fromisoformat parses them much faster than strptime
+                trade_date = date.fromisoformat(value)
+            except ValueError:
+                continue  # Right shape but not a real date (e.g. 2024-02-30)
+            if trade_date >= cutoff_date:
+                transaction_type = trade.get('transactionType') or ''
+                recent += 1
+                buys += 'P' in transaction_type
+                sells += 'S' in transaction_type
+        return recent, buys, sells
+
     def analyze_insider_sentiment(self, ticker: str, days: int = 90) -> Dict:
         """
         Analyze insider sentiment based on recent trades.
@@ -317,21 +475,11 @@ class FMPCollector:
                 'description': 'No insider trading data available'
             }
 
-        # Filter to recent trades (last N days)
-        cutoff_date = datetime.now()
-        from dateutil.relativedelta import relativedelta
-        cutoff_date = cutoff_date - relativedelta(days=days)
+        # Filter to recent trades (last N days) and count buys vs sells
+        cutoff_date = date.today() - timedelta(days=days)
+        recent_count, buys, sells = self._count_recent_trades(trades, cutoff_date)
 
-        recent_trades = []
-        for trade in trades:
-            try:
-                trade_date = datetime.strptime(trade['transactionDate'], '%Y-%m-%d')
-                if trade_date >= cutoff_date:
-                    recent_trades.append(trade)
-            except:
-                continue
-
-        if not recent_trades:
+        if not recent_count:
             return {
                 'sentiment': 'neutral',
                 'score': 0.0,
@@ -339,10 +487,6 @@ class FMPCollector:
                 'description': f'No insider trades in last {days} days'
             }
 
-        # Count buys vs sells
-        buys = sum(1 for t in recent_trades if 'P' in t.get('transactionType', ''))
-        sells = sum(1 for t in recent_trades if 'S' in t.get('transactionType', ''))
-
         # Calculate sentiment
         total = buys + sells
         if total > 0:
@@ -14,21 +14,216 @@ All data sources are FREE and don't require paid subscriptions!
 
 import yfinance as yf
 import requests
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import bisect
+import functools
+import math
+import statistics
+import threading
+import time
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
 import logging
-import pandas as pd
 
-# Import configuration
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from config.config import Config
-
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# orjson parses JSON several times faster than the standard library (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Import configuration (used for the on-disk cache location)
+# The project root is only added to sys.path when this file is run directly
+# as a script; normal imports (e.g. from src/main.py) leave sys.path alone.
+try:
+    from config.config import Config
+except ImportError:
+    import sys
+    from pathlib import Path
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+    from config.config import Config
+from src.database.response_cache import ResponseCache
+
+# Set up logging (the application configures handlers; see __main__ below)
 logger = logging.getLogger(__name__)
 
+# How long indicator results are served from memory (seconds).
+# After the TTL a result is "stale" for the same length of time again: it is
+# still returned immediately, while a fresh copy is fetched in the background.
+VIX_CACHE_TTL = 60
+BREADTH_CACHE_TTL = 60
+PUT_CALL_CACHE_TTL = 60
+ADVANCE_DECLINE_CACHE_TTL = 5 * 60
+FEAR_GREED_CACHE_TTL = 4 * 60 * 60  # Updated once a day
+COMPOSITE_CACHE_TTL = 60
+
+# Sentiment bands for each indicator, looked up with bisect instead of an
+# if/elif ladder. Each *_THRESHOLDS tuple holds the sorted cut-off values and
+# the matching *_BANDS tuple holds one (sentiment, score, description) entry
+# per band, from the lowest indicator values to the highest.
+
+# VIX: < 15 complacent, 15-25 neutral, 25-35 fearful, >= 35 panic (bisect_right)
+VIX_THRESHOLDS = (15, 25, 35)
+VIX_BANDS = (
+    ("complacent", 0.5, "Low volatility - market is calm"),  # Neutral to bullish
+    ("neutral", 0.0, "Normal volatility levels"),
+    ("fearful", -0.4, "Elevated volatility - increased fear"),
+    ("panic", -0.8, "Extreme volatility - market panic"),
+)
+
+# A/D % change: <= -5 bearish, <= 0 slightly bearish, <= 5 slightly bullish,
+# > 5 bullish (bisect_left)
+AD_THRESHOLDS = (-5, 0, 5)
+AD_BANDS = (
+    ("bearish", -0.6, "Weak market breadth - many stocks declining"),
+    ("slightly_bearish", -0.2, "Negative market breadth"),
+    ("slightly_bullish", 0.2, "Positive market breadth"),
+    ("bullish", 0.6, "Strong market breadth - many stocks advancing"),
+)
+
+# Put/call ratio: <= 0.7 bullish, <= 1.0 neutral, <= 1.5 bearish,
+# > 1.5 extreme bearish (bisect_left)
+PUT_CALL_THRESHOLDS = (0.7, 1.0, 1.5)
+PUT_CALL_BANDS = (
+    ("bullish", 0.4, "More calls than puts - bullish sentiment"),
+    ("neutral", 0.0, "Balanced put/call ratio"),
+    ("bearish", -0.4, "More puts than calls - bearish sentiment"),
+    ("extreme_bearish", 0.3, "Extreme bearishness (contrarian buy signal)"),  # Contrarian bullish signal
+)
+
+# Fear & Greed value: 0-25 Extreme Fear, 25-45 Fear, 45-55 Neutral,
+# 55-75 Greed, 75-100 Extreme Greed (bisect_right, scores only)
+FEAR_GREED_THRESHOLDS = (25, 45, 55, 75)
+FEAR_GREED_SCORES = (-0.8, -0.4, 0.0, 0.4, 0.8)
+
+# Price histories that are also kept in the on-disk cache (seconds), so a
+# restarted process doesn't have to download them again
+CHART_DISK_CACHE_TTLS = {
+    "^ISSU": ADVANCE_DECLINE_CACHE_TTL,
+    "^ISSQ": ADVANCE_DECLINE_CACHE_TTL,
+}
+
+# Yahoo Finance chart API (the same endpoint yfinance's history() uses)
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{}"
+
+
+class _TTLCache:
+    """
+    In-memory cache of indicator results with stale-while-revalidate.
+
+    Each entry is fresh until its TTL runs out, then stale for a while longer.
+    Fresh entries are returned as-is. Stale entries are returned too, but a
+    background thread fetches a replacement. Expired entries are fetched again
+    before returning.
+
+    If a fetch fails (returns an empty result), the last good result is
+    returned instead, however old, with 'stale': True added - so a short
+    Yahoo Finance outage doesn't silently drop an indicator from the
+    composite score.
+    """
+
+    def __init__(self):
+        self._entries = {}  # key -> (value, fresh_until, stale_until)
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def get_or_fetch(self, key, fetch: Callable[[], Dict], ttl: float, stale_ttl: float) -> Dict:
+        """
+        Get a cached result, fetching it if needed.
+
+        Args:
+            key: Hashable cache key
+            fetch: Function that fetches the result
+            ttl: Seconds the result stays fresh
+            stale_ttl: Extra seconds a stale result may still be served
+
+        Returns:
+            A copy of the cached (or newly fetched) result
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None:
+            value, fresh_until, stale_until = entry
+            if now < fresh_until:
+                return dict(value)
+            if now < stale_until:
+                self._refresh_in_background(key, fetch, ttl, stale_ttl)
+                return dict(value)
+
+        value = fetch()
+        if value:
+            self._store(key, value, ttl, stale_ttl)
+            return dict(value)
+
+        if entry is not None:
+            logger.warning(f"Fetch failed, using the last good result for {key[0]}")
+            stale_value = dict(entry[0])
+            stale_value['stale'] = True
+            return stale_value
+
+        return value
+
+    def _store(self, key, value: Dict, ttl: float, stale_ttl: float):
+        """Remember a result (empty results mean the fetch failed and are not kept)."""
+        if not value:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (value, now + ttl, now + ttl + stale_ttl)
+
+    def _refresh_in_background(self, key, fetch: Callable[[], Dict], ttl: float, stale_ttl: float):
+        """Fetch a replacement for a stale entry on a worker thread (once per key)."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=2)
+
+        def refresh():
+            try:
+                self._store(key, fetch(), ttl, stale_ttl)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._executor.submit(refresh)
+
+
+def cached(ttl: float, stale_ttl: Optional[float] = None):
+    """
+    Decorator that caches a MarketIndicators method's result (see _TTLCache).
+
+    Calls with pre-fetched data (DataFrames, dictionaries) can't be used as
+    cache keys, so they always run the method.
+
+    Args:
+        ttl: Seconds a result stays fresh
+        stale_ttl: Extra seconds a stale result may be served (default: ttl)
+    """
+    stale_ttl = ttl if stale_ttl is None else stale_ttl
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return method(self, *args, **kwargs)
+
+            return self._cache.get_or_fetch(
+                key, lambda: method(self, *args, **kwargs), ttl, stale_ttl
+            )
+        return wrapper
+    return decorator
+
 
 class MarketIndicators:
     """
@@ -40,14 +235,142 @@ class MarketIndicators:
     - Alternative Data (free) - Various free sources
     """
 
-    def __init__(self):
-        """Initialize the market indicators collector."""
+    def __init__(self, use_cache: bool = True):
+        """
+        Initialize the market indicators collector.
+
+        Args:
+            use_cache: Keep slow-moving data (Fear & Greed, A/D history) in an
+                       on-disk cache that survives restarts
+        """
+        # One session for every request, so connections to Yahoo are reused.
+        # The pool is sized for the concurrent fetches in _batch_history, and
+        # transient errors (rate limiting, 5xx) are retried with a short backoff.
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"]
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Yahoo rejects requests without a browser-like User-Agent
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0',
+            'Accept-Encoding': 'gzip, deflate'
+        })
+
+        # Recent indicator results (see the @cached methods)
+        self._cache = _TTLCache()
+
+        # yfinance Ticker objects, reused across calls (see _ticker)
+        self._tickers: Dict[str, yf.Ticker] = {}
+
+        # On-disk cache shared by every process (see CHART_DISK_CACHE_TTLS)
+        self.disk_cache = ResponseCache(Config.DATA_DIR / 'indicator_cache.db') if use_cache else None
+
         logger.info("Market indicators collector initialized")
 
+    def _ticker(self, symbol: str) -> yf.Ticker:
+        """
+        Get the yfinance Ticker for a symbol, creating it on first use.
+
+        Args:
+            symbol: Ticker symbol (e.g. "SPY")
+
+        Returns:
+            yfinance Ticker object (the same one every time)
+        """
+        ticker = self._tickers.get(symbol)
+        if ticker is None:
+            ticker = self._tickers.setdefault(symbol, yf.Ticker(symbol))
+        return ticker
+
+    def _fetch_chart(self, symbol: str, period: str = "1mo") -> List[float]:
+        """
+        Get daily closing prices straight from Yahoo Finance's chart API.
+
+        This skips building a yfinance Ticker and a pandas DataFrame, which
+        is a lot of work when only the closing prices are needed.
+
+        Args:
+            symbol: Ticker symbol (e.g. "^VIX", "SPY")
+            period: Time period (1d, 5d, 1mo, 3mo, 1y, etc.)
+
+        Returns:
+            List of closing prices, oldest first (dividend/split adjusted
+            like Ticker.history(), days without a price are skipped)
+
+        Raises:
+            requests.RequestException, KeyError, IndexError: If the request
+            fails or the response has no price data
+        """
+        disk_ttl = CHART_DISK_CACHE_TTLS.get(symbol) if self.disk_cache else None
+        if disk_ttl:
+            cache_key = ResponseCache.make_key('chart', symbol, period)
+            closes = self.disk_cache.get(cache_key)
+            if closes is not None:
+                return closes
+
+        response = self.session.get(
+            YAHOO_CHART_URL.format(quote(symbol)),
+            params={'range': period, 'interval': '1d'},
+            timeout=10
+        )
+        response.raise_for_status()
+
+        data = orjson.loads(response.content) if orjson else response.json()
+        indicators = data['chart']['result'][0]['indicators']
+        if indicators.get('adjclose'):
+            closes = indicators['adjclose'][0]['adjclose']
+        else:
+            closes = indicators['quote'][0]['close']
+
+        closes = [close for close in closes if close is not None]
+
+        if disk_ttl and closes:
+            self.disk_cache.set(cache_key, closes, ttl=disk_ttl)
+
+        return closes
+
+    def _batch_history(self, tickers: List[str], period: str = "1mo") -> Dict[str, List[float]]:
+        """
+        Get daily closing prices for several tickers at the same time.
+
+        Args:
+            tickers: Ticker symbols (e.g. ["^VIX", "SPY"])
+            period: Time period (1d, 5d, 1mo, 3mo, 1y, etc.)
+
+        Returns:
+            Dictionary mapping each ticker to its closing prices
+            (an empty list if they could not be fetched)
+        """
+        logger.info(f"Fetching price history for {', '.join(tickers)}")
+
+        def fetch(ticker):
+            try:
+                return self._fetch_chart(ticker, period)
+            except requests.RequestException as e:
+                logger.warning(f"Network error fetching price history for {ticker}: {e}")
+                return []
+            except Exception as e:
+                logger.error(f"Error fetching price history for {ticker}: {e}")
+                return []
+
+        # The requests share self.session's connections and run side by side
+        with ThreadPoolExecutor(max_workers=len(tickers) or 1) as executor:
+            return dict(zip(tickers, executor.map(fetch, tickers)))
+
     # ==================== VIX (Volatility Index) ====================
 
-    def get_vix(self, period: str = "1mo") -> Dict:
+    @cached(ttl=VIX_CACHE_TTL)
+    def get_vix(self, period: str = "1mo", closes: Optional[List[float]] = None) -> Dict:
         """
         Get VIX (CBOE Volatility Index) data.
 
@@ -59,6 +382,7 @@ class MarketIndicators:
 
         Args:
             period: Time period (1d, 5d, 1mo, 3mo, 1y, etc.)
+            closes: Already downloaded ^VIX closing prices (fetched here if None)
 
         Returns:
             Dictionary with VIX data and analysis
@@ -68,37 +392,23 @@ class MarketIndicators:
         try:
             logger.info(f"Fetching VIX data for period: {period}")
 
-            # Fetch VIX using yfinance
-            vix = yf.Ticker("^VIX")
-            hist = vix.history(period=period)
+            # Fetch VIX from Yahoo Finance (unless the caller already has it)
+            if closes is None:
+                closes = self._fetch_chart("^VIX", period)
 
-            if hist.empty:
+            if not closes:
                 logger.warning("No VIX data retrieved")
                 return {}
 
             # Get current and historical values
-            current_vix = hist['Close'].iloc[-1]
-            avg_vix = hist['Close'].mean()
-            max_vix = hist['Close'].max()
-            min_vix = hist['Close'].min()
+            current_vix = closes[-1]
+            avg_vix = statistics.fmean(closes)
+            max_vix = max(closes)
+            min_vix = min(closes)
 
             # Calculate sentiment based on VIX level
-            if current_vix < 15:
-                sentiment = "complacent"
-                score = 0.5  # Neutral to bullish
-                description = "Low volatility - market is calm"
-            elif current_vix < 25:
-                sentiment = "neutral"
-                score = 0.0
-                description = "Normal volatility levels"
-            elif current_vix < 35:
-                sentiment = "fearful"
-                score = -0.4
-                description = "Elevated volatility - increased fear"
-            else:
-                sentiment = "panic"
-                score = -0.8
-                description = "Extreme volatility - market panic"
+            band = bisect.bisect_right(VIX_THRESHOLDS, current_vix)
+            sentiment, score, description = VIX_BANDS[band]
 
             return {
                 'current_vix': float(current_vix),
@@ -111,13 +421,23 @@ class MarketIndicators:
                 'timestamp': datetime.now()
             }
 
+        except requests.RequestException as e:
+            # Timeouts, connection errors, HTTP errors - expected now and then
+            logger.warning(f"Network error fetching VIX data: {e}")
+            return {}
+        except (KeyError, IndexError) as e:
+            logger.warning(f"Unexpected response fetching VIX data: missing {e}")
+            return {}
         except Exception as e:
             logger.error(f"Error fetching VIX data: {e}")
             return {}
 
     # ==================== Advance/Decline Line ====================
 
-    def get_advance_decline_line(self, period: str = "1mo") -> Dict:
+    @cached(ttl=ADVANCE_DECLINE_CACHE_TTL)
+    def get_advance_decline_line(self, period: str = "1mo",
+                                 nyse_closes: Optional[List[float]] = None,
+                                 nasdaq_closes: Optional[List[float]] = None) -> Dict:
         """
         Calculate Advance/Decline Line for market breadth.
 
@@ -128,6 +448,8 @@ class MarketIndicators:
 
         Args:
             period: Time period to analyze
+            nyse_closes: Already downloaded ^ISSU closing values (fetched here if None)
+            nasdaq_closes: Already downloaded ^ISSQ closing values (fetched here if None)
 
         Returns:
             Dictionary with A/D line data and analysis
@@ -142,13 +464,16 @@ class MarketIndicators:
             # ^ISSU = NYSE Advance/Decline/Unchanged
             # ^ISSQ = NASDAQ Advance/Decline/Unchanged
 
-            nyse_ad = yf.Ticker("^ISSU")
-            nasdaq_ad = yf.Ticker("^ISSQ")
+            # Fetch whichever series the caller didn't pass in. Both requests
+            # run at the same time, and one failing doesn't lose the other.
+            missing = [symbol for symbol, closes in (("^ISSU", nyse_closes), ("^ISSQ", nasdaq_closes))
+                       if closes is None]
+            if missing:
+                histories = self._batch_history(missing, period)
+                nyse_closes = histories.get("^ISSU", nyse_closes)
+                nasdaq_closes = histories.get("^ISSQ", nasdaq_closes)
 
-            nyse_hist = nyse_ad.history(period=period)
-            nasdaq_hist = nasdaq_ad.history(period=period)
-
-            if nyse_hist.empty and nasdaq_hist.empty:
+            if not nyse_closes and not nasdaq_closes:
                 logger.warning("No A/D data retrieved")
                 return {}
 
@@ -156,37 +481,23 @@ class MarketIndicators:
             # Positive change = more advances than declines
             result = {}
 
-            if not nyse_hist.empty:
-                nyse_change = nyse_hist['Close'].iloc[-1] - nyse_hist['Close'].iloc[0]
-                nyse_pct_change = (nyse_change / nyse_hist['Close'].iloc[0]) * 100
+            if nyse_closes:
+                nyse_change = nyse_closes[-1] - nyse_closes[0]
+                nyse_pct_change = (nyse_change / nyse_closes[0]) * 100
                 result['nyse_ad_change'] = float(nyse_change)
                 result['nyse_ad_pct'] = float(nyse_pct_change)
 
-            if not nasdaq_hist.empty:
-                nasdaq_change = nasdaq_hist['Close'].iloc[-1] - nasdaq_hist['Close'].iloc[0]
-                nasdaq_pct_change = (nasdaq_change / nasdaq_hist['Close'].iloc[0]) * 100
+            if nasdaq_closes:
+                nasdaq_change = nasdaq_closes[-1] - nasdaq_closes[0]
+                nasdaq_pct_change = (nasdaq_change / nasdaq_closes[0]) * 100
                 result['nasdaq_ad_change'] = float(nasdaq_change)
                 result['nasdaq_ad_pct'] = float(nasdaq_pct_change)
 
             # Determine overall sentiment
             avg_pct = (result.get('nyse_ad_pct', 0) + result.get('nasdaq_ad_pct', 0)) / 2
 
-            if avg_pct > 5:
-                sentiment = "bullish"
-                score = 0.6
-                description = "Strong market breadth - many stocks advancing"
-            elif avg_pct > 0:
-                sentiment = "slightly_bullish"
-                score = 0.2
-                description = "Positive market breadth"
-            elif avg_pct > -5:
-                sentiment = "slightly_bearish"
-                score = -0.2
-                description = "Negative market breadth"
-            else:
-                sentiment = "bearish"
-                score = -0.6
-                description = "Weak market breadth - many stocks declining"
+            band = bisect.bisect_left(AD_THRESHOLDS, avg_pct)
+            sentiment, score, description = AD_BANDS[band]
 
             result.update({
                 'sentiment': sentiment,
@@ -198,12 +509,20 @@ class MarketIndicators:
 
             return result
 
+        except requests.RequestException as e:
+            # Timeouts, connection errors, HTTP errors - expected now and then
+            logger.warning(f"Network error fetching A/D line data: {e}")
+            return {}
+        except (KeyError, IndexError) as e:
+            logger.warning(f"Unexpected response fetching A/D line data: missing {e}")
+            return {}
         except Exception as e:
             logger.error(f"Error fetching A/D line data: {e}")
             return {}
 
     # ==================== Put/Call Ratio ====================
 
+    @cached(ttl=PUT_CALL_CACHE_TTL)
     def get_put_call_ratio_estimate(self, ticker: str = "SPY") -> Dict:
         """
         Estimate put/call ratio using options volume data.
@@ -227,20 +546,28 @@ class MarketIndicators:
             logger.info(f"Estimating put/call ratio for {ticker}")
 
             # Get options data from yfinance
-            stock = yf.Ticker(ticker)
+            stock = self._ticker(ticker)
+
+            # Get the options chain for the nearest expiration date.
+            # Without a date Yahoo returns the nearest expiration together with
+            # the list of all expiration dates, so this is a single request
+            # (asking for stock.options first and then option_chain(date)
+            # downloaded the same chain twice).
+            options = stock.option_chain()
 
-            # Get available expiration dates
+            # The expiration dates are already known from the request above
             expirations = stock.options
 
-            if not expirations:
+            if not expirations or options.calls is None:
                 logger.warning(f"No options data available for {ticker}")
                 return {}
 
-            # Use nearest expiration date
-            nearest_exp = expirations[0]
-
-            # Get options chain
-            options = stock.option_chain(nearest_exp)
+            # Nearest expiration date (the one the chain above belongs to).
+            # A reused Ticker also remembers dates that have already passed,
+            # so skip those rather than taking the first entry.
+            today = datetime.now(timezone.utc).date().isoformat()
+            upcoming = [exp for exp in expirations if exp >= today]
+            nearest_exp = min(upcoming) if upcoming else max(expirations)
 
             # Calculate total volume for puts and calls
             calls_volume = options.calls['volume'].sum()
@@ -253,22 +580,8 @@ class MarketIndicators:
                 pc_ratio = 0
 
             # Determine sentiment
-            if pc_ratio > 1.5:
-                sentiment = "extreme_bearish"
-                score = 0.3  # Contrarian bullish signal
-                description = "Extreme bearishness (contrarian buy signal)"
-            elif pc_ratio > 1.0:
-                sentiment = "bearish"
-                score = -0.4
-                description = "More puts than calls - bearish sentiment"
-            elif pc_ratio > 0.7:
-                sentiment = "neutral"
-                score = 0.0
-                description = "Balanced put/call ratio"
-            else:
-                sentiment = "bullish"
-                score = 0.4
-                description = "More calls than puts - bullish sentiment"
+            band = bisect.bisect_left(PUT_CALL_THRESHOLDS, pc_ratio)
+            sentiment, score, description = PUT_CALL_BANDS[band]
 
             return {
                 'ticker': ticker,
@@ -288,6 +601,7 @@ class MarketIndicators:
 
     # ==================== Fear & Greed Index ====================
 
+    @cached(ttl=FEAR_GREED_CACHE_TTL)
     def get_fear_greed_index_alternative(self) -> Dict:
         """
         Get Fear & Greed Index from Alternative.me (Crypto focused).
@@ -304,12 +618,20 @@ class MarketIndicators:
         try:
             logger.info("Fetching Fear & Greed Index")
 
-            # Alternative.me provides a free API for crypto fear & greed
-            url = "https://api.alternative.me/fng/"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            # The index is published once a day, so the API response is kept
+            # on disk per (UTC) day and reused across restarts
+            cache_key = ResponseCache.make_key('fng', datetime.now(timezone.utc).date().isoformat())
+            data = self.disk_cache.get(cache_key) if self.disk_cache else None
+
+            if data is None:
+                # Alternative.me provides a free API for crypto fear & greed
+                url = "https://api.alternative.me/fng/"
+                response = self.session.get(url, timeout=10)
+                response.raise_for_status()
 
-            data = response.json()
+                data = orjson.loads(response.content) if orjson else response.json()
+                if self.disk_cache and data.get('data'):
+                    self.disk_cache.set(cache_key, data, ttl=FEAR_GREED_CACHE_TTL)
 
             if 'data' not in data or not data['data']:
                 return {}
@@ -325,17 +647,7 @@ class MarketIndicators:
             # 45-55: Neutral (0.0)
             # 55-75: Greed (0.4)
             # 75-100: Extreme Greed (0.8)
-
-            if value < 25:
-                score = -0.8
-            elif value < 45:
-                score = -0.4
-            elif value < 55:
-                score = 0.0
-            elif value < 75:
-                score = 0.4
-            else:
-                score = 0.8
+            score = FEAR_GREED_SCORES[bisect.bisect_right(FEAR_GREED_THRESHOLDS, value)]
 
             return {
                 'value': value,
@@ -345,13 +657,22 @@ class MarketIndicators:
                 'source': 'Alternative.me (Crypto)'
             }
 
+        except requests.RequestException as e:
+            # Timeouts, connection errors, HTTP errors - expected now and then
+            logger.warning(f"Network error fetching Fear & Greed Index: {e}")
+            return {}
+        except (KeyError, IndexError) as e:
+            logger.warning(f"Unexpected response fetching Fear & Greed Index: missing {e}")
+            return {}
         except Exception as e:
             logger.error(f"Error fetching Fear & Greed Index: {e}")
             return {}
 
     # ==================== Market Breadth (S&P 500) ====================
 
-    def get_market_breadth_spy(self, period: str = "1mo") -> Dict:
+    @cached(ttl=BREADTH_CACHE_TTL)
+    def get_market_breadth_spy(self, period: str = "1mo", vix_data: Optional[Dict] = None,
+                               closes: Optional[List[float]] = None) -> Dict:
         """
         Analyze market breadth using SPY vs individual stocks.
 
@@ -360,6 +681,8 @@ class MarketIndicators:
 
         Args:
             period: Time period to analyze
+            vix_data: Result of get_vix() if already fetched (fetched here if None)
+            closes: Already downloaded SPY closing prices (fetched here if None)
 
         Returns:
             Dictionary with market breadth analysis
@@ -368,18 +691,28 @@ class MarketIndicators:
             logger.info("Analyzing market breadth via SPY")
 
             # Get SPY data
-            spy = yf.Ticker("SPY")
-            spy_hist = spy.history(period=period)
+            if closes is None:
+                closes = self._fetch_chart("SPY", period)
 
-            if spy_hist.empty:
+            if not closes:
                 return {}
 
             # Calculate SPY performance
-            spy_return = ((spy_hist['Close'].iloc[-1] / spy_hist['Close'].iloc[0]) - 1) * 100
-            spy_volatility = spy_hist['Close'].pct_change().std() * 100
+            spy_return = ((closes[-1] / closes[0]) - 1) * 100
+            daily_returns = [today / yesterday - 1 for yesterday, today in zip(closes, closes[1:])]
+            if len(daily_returns) > 1:
+                # Sample standard deviation (same as pandas' std()). statistics.stdev
+                # would give the same number but does exact fraction arithmetic,
+                # which is about 20x slower; fmean + fsum stay in fast floats.
+                mean_return = statistics.fmean(daily_returns)
+                variance = math.fsum((r - mean_return) ** 2 for r in daily_returns) / (len(daily_returns) - 1)
+                spy_volatility = math.sqrt(variance) * 100
+            else:
+                spy_volatility = float('nan')  # Not enough data (matches pandas' std())
 
             # Simple breadth indicator: if SPY is up but VIX is also up, it's narrow leadership
-            vix_data = self.get_vix(period=period)
+            if vix_data is None:
+                vix_data = self.get_vix(period=period)
 
             if vix_data:
                 # If market is up but VIX is high: narrow breadth (bad)
@@ -414,12 +747,20 @@ class MarketIndicators:
                 'timestamp': datetime.now()
             }
 
+        except requests.RequestException as e:
+            # Timeouts, connection errors, HTTP errors - expected now and then
+            logger.warning(f"Network error analyzing market breadth: {e}")
+            return {}
+        except (KeyError, IndexError) as e:
+            logger.warning(f"Unexpected response analyzing market breadth: missing {e}")
+            return {}
         except Exception as e:
             logger.error(f"Error analyzing market breadth: {e}")
             return {}
 
     # ==================== Composite Sentiment Score ====================
 
+    @cached(ttl=COMPOSITE_CACHE_TTL)
     def get_overall_market_sentiment(self) -> Dict:
         """
         Calculate composite market sentiment from all indicators.
@@ -436,11 +777,20 @@ class MarketIndicators:
         try:
             logger.info("Calculating overall market sentiment")
 
-            # Collect all indicators
-            vix = self.get_vix()
-            ad_line = self.get_advance_decline_line()
-            pc_ratio = self.get_put_call_ratio_estimate("SPY")
-            breadth = self.get_market_breadth_spy()
+            # Collect all indicators. The options data is fetched in the background
+            # while _batch_history gets the price history for every other
+            # indicator, so the Yahoo Finance waits overlap instead of adding up.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pc_future = executor.submit(self.get_put_call_ratio_estimate, "SPY")
+                histories = self._batch_history(["^VIX", "^ISSU", "^ISSQ", "SPY"])
+                pc_ratio = pc_future.result()
+
+            vix = self.get_vix(closes=histories["^VIX"])
+            ad_line = self.get_advance_decline_line(
+                nyse_closes=histories["^ISSU"], nasdaq_closes=histories["^ISSQ"]
+            )
+            # Breadth reuses the VIX result instead of fetching VIX a second time
+            breadth = self.get_market_breadth_spy(vix_data=vix, closes=histories["SPY"])
 
             # Calculate weighted average score
             scores = []
@@ -495,6 +845,22 @@ class MarketIndicators:
             logger.error(f"Error calculating overall sentiment: {e}")
             return {}
 
+    async def aget_overall_market_sentiment(self) -> Dict:
+        """
+        Async version of get_overall_market_sentiment for asyncio applications.
+
+        The indicators are collected on a worker thread (where their requests
+        already run concurrently), so the event loop is never blocked.
+
+        Returns:
+            Dictionary with composite sentiment analysis
+
+        Example:
+            sentiment = await collector.aget_overall_market_sentiment()
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_overall_market_sentiment)
+
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -502,6 +868,8 @@ if __name__ == "__main__":
     Test the market indicators collector.
     All indicators are FREE - no API keys needed!
     """
+    logging.basicConfig(level=logging.INFO)
+
     print("\n" + "="*70)
     print("MARKET SENTIMENT INDICATORS - FREE DATA SOURCES")
     print("="*70 + "\n")
@@ -548,7 +916,8 @@ if __name__ == "__main__":
 
     print("\n4. Market Breadth (SPY)")
     print("-" * 70)
-    breadth = collector.get_market_breadth_spy(period="1mo")
+    # Reuse the VIX result from test 1 instead of fetching it again
+    breadth = collector.get_market_breadth_spy(period="1mo", vix_data=vix or None)
     if breadth:
         print(f"SPY Return: {breadth['spy_return_pct']:.2f}%")
         print(f"SPY Volatility: {breadth['spy_volatility']:.2f}%")
@@ -11,23 +11,42 @@ The SEC provides free access to EDGAR data but requires:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import logging
-from bs4 import BeautifulSoup
 import json
 
+# orjson parses JSON several times faster than the standard library (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import our configuration
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from config.config import Config
+from src.database.response_cache import ResponseCache
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# How long cached responses stay valid (in seconds)
+# The ticker -> CIK list rarely changes; new filings show up during the day
+TICKER_MAP_CACHE_TTL = 24 * 60 * 60  # 24 hours
+FILINGS_CACHE_TTL = 60 * 60          # 1 hour
+# After the entries above expire, their last copy and its ETag are kept this
+# long so the SEC can answer "not modified" instead of sending it all again
+REVALIDATE_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+
 
 class SECEdgarCollector:
     """
@@ -43,58 +62,99 @@ class SECEdgarCollector:
     - 10-Q/10-K: Quarterly/Annual reports
     """
 
-    def __init__(self):
+    # Ticker -> CIK map from company_tickers.json, shared by every collector
+    # in this process (downloaded or read from the disk cache on first use)
+    _ticker_to_cik: Optional[Dict[str, str]] = None
+    _ticker_map_lock = threading.Lock()
+
+    def __init__(self, use_cache: bool = True):
         """
         Initialize the SEC EDGAR collector.
         Sets up headers and rate limiting.
+
+        Args:
+            use_cache: Keep the ticker list and filing lists in a disk cache
+                       so new runs don't have to download them again
         """
         # SEC requires a User-Agent header with contact information
         self.headers = {
             'User-Agent': Config.SEC_USER_AGENT,
-            'Accept-Encoding': 'gzip, deflate',
-            'Host': 'www.sec.gov'
+            'Accept-Encoding': 'gzip, deflate'
         }
 
+        # Reuse one HTTP session so the connection to the SEC is kept alive
+        # between calls instead of doing a new TCP/TLS handshake every time.
+        # Throttled (429) and server-error responses are retried with back-off.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        ))
+
         # Base URLs for SEC EDGAR
         self.base_url = 'https://www.sec.gov'
         self.cik_lookup_url = f'{self.base_url}/cgi-bin/browse-edgar'
-        self.submissions_url = f'{self.base_url}/cgi-bin/browse-edgar'
+        # Structured JSON list of every company's filings (note: different host)
+        self.submissions_url = 'https://data.sec.gov/submissions'
 
         # Rate limiting: SEC allows max 10 requests per second
         self.min_request_interval = 1.0 / Config.SEC_RATE_LIMIT  # 0.1 seconds
-        self.last_request_time = 0
+        # time.monotonic() at which the next request is allowed to start
+        self._next_ts = 0.0
+        # Makes the rate limiter safe when requests come from several threads
+        self._rate_limit_lock = threading.Lock()
+
+        # Persistent response cache (shared across runs)
+        self.cache = ResponseCache(Config.DATA_DIR / 'sec_cache.db') if use_cache else None
 
         logger.info("SEC EDGAR collector initialized")
 
     def _rate_limit(self):
         """
-        Enforce rate limiting to comply with SEC requirements.
+        Enforce rate limiting to comply with SEC requirements (thread-safe).
         Waits if necessary to maintain max 10 requests/second.
-        """
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
 
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
-            time.sleep(sleep_time)
+        Keeps a "next allowed start time" on the monotonic clock, which (unlike
+        time.time) never jumps when the system clock is adjusted.
+        """
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            wait = self._next_ts - now
+            if wait > 0:
+                time.sleep(wait)
 
-        self.last_request_time = time.time()
+            self._next_ts = max(now, self._next_ts) + self.min_request_interval
 
-    def _make_request(self, url: str, params: Optional[Dict] = None) -> Optional[requests.Response]:
+    def _make_request(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        etag: Optional[str] = None
+    ) -> Optional[requests.Response]:
         """
         Make a rate-limited request to SEC EDGAR.
 
         Args:
             url: URL to request
             params: Optional query parameters
+            etag: ETag of a copy we already have. If the file hasn't changed,
+                  the SEC answers 304 (Not Modified) with an empty body.
 
         Returns:
             Response object or None if request failed
         """
         self._rate_limit()
 
+        headers = {'If-None-Match': etag} if etag else None
+
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            response = self.session.get(url, params=params, headers=headers, timeout=10)
             response.raise_for_status()
             return response
         except requests.exceptions.RequestException as e:
@@ -117,24 +177,15 @@ class SECEdgarCollector:
         Note: This uses the SEC's company tickers JSON endpoint
         """
         try:
-            # SEC provides a JSON file mapping tickers to CIKs
-            url = f'{self.base_url}/files/company_tickers.json'
-            response = self._make_request(url)
-
-            if not response:
+            ticker_to_cik = self._load_ticker_map()
+            if ticker_to_cik is None:
                 return None
 
-            # Parse the JSON data
-            data = response.json()
-
-            # Search for the ticker
             ticker = ticker.upper()
-            for entry in data.values():
-                if entry['ticker'].upper() == ticker:
-                    # CIK needs to be padded with zeros to 10 digits
-                    cik = str(entry['cik_str']).zfill(10)
-                    logger.info(f"Found CIK for {ticker}: {cik}")
-                    return cik
+            cik = ticker_to_cik.get(ticker)
+            if cik:
+                logger.info(f"Found CIK for {ticker}: {cik}")
+                return cik
 
             logger.warning(f"CIK not found for ticker: {ticker}")
             return None
@@ -143,6 +194,86 @@ class SECEdgarCollector:
             logger.error(f"Error getting CIK for {ticker}: {e}")
             return None
 
+    def _load_ticker_map(self) -> Optional[Dict[str, str]]:
+        """
+        Get the mapping of ticker symbols to CIKs, downloading it on first use.
+
+        The SEC's company_tickers.json lists ~10,000 companies. It is downloaded
+        and turned into a dictionary once per process (the dictionary is shared
+        by all collectors), so every later lookup is a single dictionary access
+        instead of a download plus a full scan. The dictionary is also kept in
+        the disk cache for a day, so a new run can skip the ~1 MB download entirely.
+
+        A failed download is not remembered, so the next call tries again.
+
+        Returns:
+            Dictionary of upper-case ticker -> 10-digit CIK string,
+            or None if the file could not be downloaded
+        """
+        # The lock makes sure only one thread downloads the file
+        with SECEdgarCollector._ticker_map_lock:
+            if SECEdgarCollector._ticker_to_cik is None:
+                SECEdgarCollector._ticker_to_cik = self._fetch_ticker_map()
+            return SECEdgarCollector._ticker_to_cik
+
+    def _fetch_ticker_map(self) -> Optional[Dict[str, str]]:
+        """
+        Read the ticker -> CIK map from the disk cache, or download and build it.
+
+        Returns:
+            Dictionary of upper-case ticker -> 10-digit CIK string,
+            or None if the file could not be downloaded
+        """
+        cache_key = ResponseCache.make_key('company_tickers')
+        revalidate_key = ResponseCache.make_key('company_tickers', 'etag')
+        previous = None
+        if self.cache:
+            ticker_to_cik = self.cache.get(cache_key)
+            if ticker_to_cik is not None:
+                return ticker_to_cik
+            previous = self.cache.get(revalidate_key)
+
+        # SEC provides a JSON file mapping tickers to CIKs
+        url = f'{self.base_url}/files/company_tickers.json'
+        response = self._make_request(url, etag=previous['etag'] if previous else None)
+
+        if not response:
+            return None
+
+        # Unchanged since last time: reuse our copy and skip the ~1 MB download
+        if response.status_code == 304:
+            self.cache.set(cache_key, previous['data'], TICKER_MAP_CACHE_TTL)
+            return previous['data']
+
+        # Parse the JSON data (~1 MB, so the faster parser pays off here)
+        data = orjson.loads(response.content) if orjson else response.json()
+
+        # CIK needs to be padded with zeros to 10 digits.
+        # setdefault keeps the first entry if a ticker is listed twice.
+        ticker_to_cik = {}
+        for entry in data.values():
+            ticker_to_cik.setdefault(entry['ticker'].upper(), str(entry['cik_str']).zfill(10))
+
+        if self.cache:
+            self.cache.set(cache_key, ticker_to_cik, TICKER_MAP_CACHE_TTL)
+            self._remember_etag(revalidate_key, response, ticker_to_cik)
+
+        return ticker_to_cik
+
+    def _remember_etag(self, key: str, response: requests.Response, data):
+        """
+        Keep the result of a response together with its ETag, so the next
+        download of the same URL can be skipped when nothing has changed.
+
+        Args:
+            key: Cache key to store under
+            response: Response the data was built from
+            data: What we built from it (JSON-serializable)
+        """
+        etag = response.headers.get('ETag')
+        if etag:
+            self.cache.set(key, {'etag': etag, 'data': data}, REVALIDATE_CACHE_TTL)
+
     def get_recent_filings(
         self,
         ticker: str,
@@ -173,60 +304,115 @@ class SECEdgarCollector:
             logger.error(f"Cannot get filings: CIK not found for {ticker}")
             return []
 
+        # Serve the filing list from the disk cache if we fetched it recently
+        cache_key = ResponseCache.make_key('filings', ticker, cik, filing_type, count)
+        revalidate_key = ResponseCache.make_key('filings', ticker, cik, filing_type, count, 'etag')
+        previous = None
+        if self.cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Cache hit for {ticker} {filing_type} filings")
+                return cached
+            previous = self.cache.get(revalidate_key)
+
         try:
-            # Use SEC's submissions endpoint
-            url = f'{self.base_url}/cgi-bin/browse-edgar'
-            params = {
-                'action': 'getcompany',
-                'CIK': cik,
-                'type': filing_type,
-                'dateb': '',  # End date (empty = today)
-                'owner': 'include',  # Include insider filings
-                'count': count,
-                'search_text': ''
-            }
+            # Use SEC's submissions endpoint - structured JSON, so there is
+            # no HTML page to download and parse
+            url = f'{self.submissions_url}/CIK{cik}.json'
 
-            response = self._make_request(url, params=params)
+            response = self._make_request(url, etag=previous['etag'] if previous else None)
             if not response:
                 return []
 
-            # Parse the HTML response
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Find the filings table
-            filings_table = soup.find('table', {'class': 'tableFile2'})
-            if not filings_table:
+            # Nothing new since our last copy
+            if response.status_code == 304:
+                logger.debug(f"{ticker} {filing_type} filings not modified")
+                self.cache.set(cache_key, previous['data'], FILINGS_CACHE_TTL)
+                return previous['data']
+
+            data = orjson.loads(response.content) if orjson else response.json()
+
+            # "recent" holds the company's latest filings (newest first) as
+            # parallel lists: form[i], filingDate[i], ... describe filing i
+            recent = data['filings']['recent']
+            descriptions = recent.get('primaryDocDescription') or [''] * len(recent['form'])
+
+            # Filing documents live under the company's CIK without leading zeros
+            archive_url = f'{self.base_url}/Archives/edgar/data/{int(cik)}'
+
+            # Positions of the filings we want (newest first), stopping after
+            # `count` matches - islice reads the generator lazily, so forms
+            # further back in the list are never even compared
+            matches = islice(
+                (i for i, form in enumerate(recent['form']) if form == filing_type),
+                count
+            )
+
+            filing_dates = recent['filingDate']
+            accessions = recent['accessionNumber']
+            filings = [
+                {
+                    'ticker': ticker,
+                    'cik': cik,
+                    'filing_type': filing_type,
+                    'filing_date': filing_dates[i],
+                    'description': descriptions[i],
+                    # Index page listing all documents of the filing
+                    'document_link': f"{archive_url}/{accessions[i].replace('-', '')}/{accessions[i]}-index.htm",
+                }
+                for i in matches
+            ]
+
+            if not filings:
                 logger.warning(f"No filings found for {ticker} (type: {filing_type})")
                 return []
 
-            filings = []
-            rows = filings_table.find_all('tr')[1:]  # Skip header row
-
-            for row in rows:
-                cols = row.find_all('td')
-                if len(cols) >= 4:
-                    filing_data = {
-                        'ticker': ticker,
-                        'cik': cik,
-                        'filing_type': cols[0].text.strip(),
-                        'filing_date': cols[3].text.strip(),
-                        'description': cols[2].text.strip(),
-                    }
-
-                    # Get document link if available
-                    link = cols[1].find('a')
-                    if link:
-                        filing_data['document_link'] = self.base_url + link['href']
-
-                    filings.append(filing_data)
-
             logger.info(f"Retrieved {len(filings)} {filing_type} filings for {ticker}")
+
+            if self.cache:
+                self.cache.set(cache_key, filings, FILINGS_CACHE_TTL)
+                self._remember_etag(revalidate_key, response, filings)
             return filings
 
         except Exception as e:
             logger.error(f"Error getting filings for {ticker}: {e}")
             return []
 
+    def get_recent_filings_many(
+        self,
+        tickers: List[str],
+        filing_type: str = "4",
+        count: int = 10,
+        max_workers: int = 4
+    ) -> Dict[str, List[Dict]]:
+        """
+        Get recent filings for many companies concurrently.
+
+        Requests still respect the SEC rate limit (one request starts every
+        min_request_interval), but their network round-trips overlap instead
+        of running one after another, so the 10 requests/second budget is
+        actually used.
+
+        Args:
+            tickers: List of stock ticker symbols
+            filing_type: Type of filing (e.g., "4" for Form 4, "13F-HR" for 13F)
+            count: Number of recent filings to retrieve per company
+            max_workers: Maximum number of requests in flight at once
+
+        Returns:
+            Dictionary mapping ticker to its list of filing dictionaries
+
+        Example:
+            filings = collector.get_recent_filings_many(["AAPL", "MSFT"], "8-K")
+            apple_8ks = filings["AAPL"]
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda ticker: self.get_recent_filings(ticker, filing_type, count),
+                tickers
+            )
+            return dict(zip(tickers, results))
+
     def get_form4_filings(self, ticker: str, count: int = 10) -> List[Dict]:
         """
         Get recent Form 4 (insider trading) filings.
@@ -247,6 +433,30 @@ class SECEdgarCollector:
         """
         return self.get_recent_filings(ticker, filing_type="4", count=count)
 
+    def get_form4_filings_many(
+        self,
+        tickers: List[str],
+        count: int = 10,
+        max_workers: int = 4
+    ) -> Dict[str, List[Dict]]:
+        """
+        Get recent Form 4 (insider trading) filings for many companies at once.
+
+        Same as calling get_form4_filings for each ticker, but the requests
+        overlap (see get_recent_filings_many).
+
+        Args:
+            tickers: List of stock ticker symbols
+            count: Number of recent filings to retrieve per company
+            max_workers: Maximum number of requests in flight at once
+
+        Returns:
+            Dictionary mapping ticker to its list of Form 4 filing dictionaries
+        """
+        return self.get_recent_filings_many(
+            tickers, filing_type="4", count=count, max_workers=max_workers
+        )
+
     def get_13f_filings(self, ticker: str, count: int = 5) -> List[Dict]:
         """
         Get recent 13F filings for institutional holders.
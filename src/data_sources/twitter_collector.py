@@ -5,7 +5,8 @@ and performs sentiment analysis on them.
 """
 
 import tweepy
-import time
+import re
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import logging
@@ -32,6 +33,25 @@ class TwitterCollector:
     - Basic data cleaning and formatting
     """
 
+    # General market-related keywords used by get_trending_topics
+    TRENDING_KEYWORDS = (
+        "stock market",
+        "stocks",
+        "trading",
+        "investing"
+    )
+
+    # The keywords combined with the OR operator (built once, not on every call)
+    # -is:retweet excludes retweets, lang:en keeps only English tweets
+    _TRENDING_QUERY = " OR ".join(f'"{q}"' for q in TRENDING_KEYWORDS) + " -is:retweet lang:en"
+
+    # Filters added to every cashtag search (see search_stock_tweets)
+    CASHTAG_FILTERS = " -is:retweet lang:en"
+
+    # Longest query we build when batching tickers together
+    # (the recent-search API rejects queries over 512 characters)
+    MAX_QUERY_LENGTH = 450
+
     def __init__(self):
         """
         Initialize the Twitter collector with API credentials.
@@ -60,7 +80,9 @@ class TwitterCollector:
 
         Args:
             query: Search query (e.g., "$AAPL" for Apple stock, "stock market crash")
-            max_results: Maximum number of tweets to retrieve (10-100 per request)
+            max_results: Maximum number of tweets to retrieve. Results come in
+                         pages of up to 100 tweets, so asking for more than
+                         100 simply fetches more pages.
             start_time: Only get tweets after this time (default: last 24 hours)
 
         Returns:
@@ -77,33 +99,39 @@ class TwitterCollector:
             logger.info(f"Searching for tweets with query: {query}")
 
             # Use Twitter API v2 to search recent tweets
+            # The Paginator follows the "next page" tokens for us and stops
+            # once max_results tweets have been read
             # tweet_fields: Additional data to retrieve about each tweet
-            response = self.client.search_recent_tweets(
+            paginator = tweepy.Paginator(
+                self.client.search_recent_tweets,
                 query=query,
-                max_results=min(max_results, 100),  # API limit is 100 per request
+                max_results=min(max(max_results, 10), 100),  # API allows 10-100 per page
                 start_time=start_time,
                 tweet_fields=['created_at', 'public_metrics', 'author_id', 'lang'],
                 # public_metrics includes: retweet_count, reply_count, like_count, quote_count
             )
 
-            # Process the response
+            # Process the tweets as the pages arrive
             tweets = []
-            if response.data:
-                for tweet in response.data:
-                    # Convert tweet object to a dictionary with relevant fields
-                    tweet_data = {
-                        'id': tweet.id,
-                        'text': tweet.text,
-                        'created_at': tweet.created_at,
-                        'author_id': tweet.author_id,
-                        'language': tweet.lang,
-                        'retweet_count': tweet.public_metrics['retweet_count'],
-                        'like_count': tweet.public_metrics['like_count'],
-                        'reply_count': tweet.public_metrics['reply_count'],
-                        'quote_count': tweet.public_metrics['quote_count'],
-                    }
-                    tweets.append(tweet_data)
-
+            tweets_append = tweets.append
+            for tweet in paginator.flatten(limit=max_results):
+                # Look up the metrics dict once instead of once per count
+                metrics = tweet.public_metrics
+
+                # Convert tweet object to a dictionary with relevant fields
+                tweets_append({
+                    'id': tweet.id,
+                    'text': tweet.text,
+                    'created_at': tweet.created_at,
+                    'author_id': tweet.author_id,
+                    'language': tweet.lang,
+                    'retweet_count': metrics['retweet_count'],
+                    'like_count': metrics['like_count'],
+                    'reply_count': metrics['reply_count'],
+                    'quote_count': metrics['quote_count'],
+                })
+
+            if tweets:
                 logger.info(f"Retrieved {len(tweets)} tweets")
             else:
                 logger.warning("No tweets found for the query")
@@ -158,6 +186,10 @@ class TwitterCollector:
         """
         Search for tweets about multiple stock tickers.
 
+        Tickers are searched in batches with a single OR query per batch,
+        and each tweet is assigned to the tickers whose cashtag it contains.
+        A tweet that mentions two of the tickers is counted for both.
+
         Args:
             tickers: List of stock ticker symbols
             max_results_per_ticker: Max tweets to retrieve per ticker
@@ -169,17 +201,63 @@ class TwitterCollector:
             results = collector.search_multiple_tickers(["AAPL", "TSLA", "MSFT"])
             apple_tweets = results["AAPL"]
         """
-        all_tweets = {}
+        # Tweets found per (upper-case) ticker
+        found = defaultdict(list)
+
+        # Several tickers are searched with one query ("$AAPL OR $TSLA ..."),
+        # so N tickers cost only a few API calls instead of N
+        for batch in self._batch_tickers(tickers):
+            logger.info(f"Fetching tweets for {', '.join(batch)}")
+            query = "(" + " OR ".join(f"${ticker.upper()}" for ticker in batch) + ")" + self.CASHTAG_FILTERS
+            tweets = self.search_tweets(query, max_results=max_results_per_ticker * len(batch))
+
+            # Hand each tweet to every ticker whose cashtag it mentions.
+            # One regex for the whole batch finds them all in a single scan
+            # (\b stops $AAPL from matching $AAPLX).
+            pattern = re.compile(
+                r'\$(' + '|'.join(map(re.escape, batch)) + r')\b', re.IGNORECASE
+            )
+            for tweet in tweets:
+                # set() so a tweet that repeats a cashtag is only added once
+                for ticker in {match.upper() for match in pattern.findall(tweet['text'])}:
+                    found[ticker].append(tweet)
 
-        for ticker in tickers:
-            logger.info(f"Fetching tweets for {ticker}")
-            tweets = self.search_stock_tweets(ticker, max_results=max_results_per_ticker)
-            all_tweets[ticker] = tweets
+            # No manual delay between batches: the client was created with
+            # wait_on_rate_limit=True, so tweepy waits only when the API says
+            # the rate limit has been reached
 
-            # Be nice to the API - add a small delay between requests
-            time.sleep(1)
+        # Return the tickers as they were passed in (every ticker gets a list)
+        return {ticker: found.get(ticker.upper(), []) for ticker in tickers}
 
-        return all_tweets
+    def _batch_tickers(self, tickers: List[str]) -> List[List[str]]:
+        """
+        Split tickers into groups whose combined OR query fits the query length limit.
+
+        Args:
+            tickers: List of stock ticker symbols
+
+        Returns:
+            List of ticker groups, in the original order
+        """
+        batches = []
+        batch = []
+        # Length of "()" plus the filters that every query carries
+        length = 2 + len(self.CASHTAG_FILTERS)
+
+        for ticker in tickers:
+            # "$TICKER", plus " OR " if it isn't the first one in the group
+            extra = len(ticker) + 1 + (4 if batch else 0)
+            if batch and length + extra > self.MAX_QUERY_LENGTH:
+                batches.append(batch)
+                batch = []
+                length = 2 + len(self.CASHTAG_FILTERS)
+                extra = len(ticker) + 1
+            batch.append(ticker)
+            length += extra
+
+        if batch:
+            batches.append(batch)
+        return batches
 
     def get_trending_topics(self, max_results: int = 100) -> List[Dict]:
         """
@@ -194,19 +272,8 @@ class TwitterCollector:
         Example:
             trending = collector.get_trending_topics()
         """
-        # Search for general market-related keywords
-        queries = [
-            "stock market",
-            "stocks",
-            "trading",
-            "investing"
-        ]
-
-        # Combine queries with OR operator
-        combined_query = " OR ".join([f'"{q}"' for q in queries])
-        combined_query += " -is:retweet lang:en"
-
-        return self.search_tweets(combined_query, max_results=max_results)
+        # Search for general market-related keywords (see TRENDING_KEYWORDS)
+        return self.search_tweets(self._TRENDING_QUERY, max_results=max_results)
 
 
 # Example usage (for testing)
@@ -7,20 +7,242 @@ Perfect for beginners and small-to-medium projects.
 """
 
 import sqlite3
-from datetime import datetime
-from typing import List, Dict, Optional, Any
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Any, Sequence
 import logging
 from pathlib import Path
 
 # Import our configuration
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from config.config import Config
-
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# The project root is only added to sys.path when this file is run directly
+# as a script; normal imports (e.g. from src/main.py) leave sys.path alone.
+try:
+    from config.config import Config
+except ImportError:
+    import sys
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+    from config.config import Config
+
+# Set up logging (the app configures handlers; see src/main.py)
 logger = logging.getLogger(__name__)
 
+# Settings applied to every new connection (they only last for that connection)
+# - synchronous=NORMAL: with WAL this is still crash-safe, but skips most disk syncs
+# - temp_store=MEMORY: temporary tables/indexes for sorting stay in RAM
+# - mmap_size: read the database through memory-mapped I/O (256 MB max)
+# - cache_size: negative means KiB, so this is a 64 MB page cache
+CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+)
+
+# Adds tweets (every tweet with id > ?) to the daily sentiment_summary table.
+# Counts are added to the existing day's counts, and the averages are combined
+# weighted by how many tweets each side has.
+# Runs entirely inside SQLite - the tweets are never read back into Python.
+# (A comparison is 1 when true and 0 when false, so SUM() of it counts rows.)
+SUMMARY_ROLLUP_SQL = '''
+    INSERT INTO sentiment_summary (
+        ticker, date, source, average_sentiment, average_confidence,
+        positive_count, negative_count, neutral_count, total_count
+    )
+    SELECT
+        ticker,
+        date(created_at, 'unixepoch'),
+        'twitter',
+        AVG(sentiment_score),
+        AVG(confidence),
+        SUM(sentiment_score > 0.05),
+        SUM(sentiment_score < -0.05),
+        SUM(sentiment_score BETWEEN -0.05 AND 0.05),
+        COUNT(*)
+    FROM tweets
+    WHERE id > ?
+    GROUP BY ticker, date(created_at, 'unixepoch')
+    ON CONFLICT(ticker, date, source) DO UPDATE SET
+        average_sentiment = (average_sentiment * total_count
+                             + excluded.average_sentiment * excluded.total_count)
+                            / (total_count + excluded.total_count),
+        average_confidence = (average_confidence * total_count
+                              + excluded.average_confidence * excluded.total_count)
+                             / (total_count + excluded.total_count),
+        positive_count = positive_count + excluded.positive_count,
+        negative_count = negative_count + excluded.negative_count,
+        neutral_count = neutral_count + excluded.neutral_count,
+        total_count = total_count + excluded.total_count
+'''
+
+# How many compiled SQL statements each connection keeps (sqlite3's default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Version number of the table layout (stored in the file as PRAGMA user_version)
+# 1: tweets.created_at holds Unix time (INTEGER) instead of timestamp text
+SCHEMA_VERSION = 1
+
+# Below this many rows, bulk_load() keeps the index (dropping and rebuilding
+# it would cost more than updating it row by row)
+BULK_LOAD_MIN_ROWS = 500
+
+# Index for looking up a ticker's tweets by date (dropped during bulk loads)
+TWEETS_TICKER_CREATED_INDEX_SQL = 'CREATE INDEX IF NOT EXISTS idx_tweets_ticker_created ON tweets(ticker, created_at DESC)'
+
+# SQL statements used by DatabaseManager, defined once here.
+# Each connection keeps the compiled form of statements it has run (up to
+# STATEMENT_CACHE_SIZE), so reusing the exact same text skips re-compiling.
+
+# Tweets (INSERT OR IGNORE skips tweets that are already stored)
+INSERT_TWEET_SQL = '''
+    INSERT OR IGNORE INTO tweets (
+        tweet_id, ticker, text, created_at, author_id, language,
+        retweet_count, like_count, reply_count, quote_count,
+        sentiment_score, textblob_score, vader_score, confidence, subjectivity
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+# {columns} is filled in from TWEET_COLUMNS (never from user text)
+SELECT_TWEETS_SQL = '''
+    SELECT {columns} FROM tweets
+    WHERE ticker = ?
+    AND created_at >= ?
+    ORDER BY created_at DESC
+'''
+
+# Columns of the tweets table that get_tweet_sentiment can return
+TWEET_COLUMNS = (
+    'id', 'tweet_id', 'ticker', 'text', 'created_at', 'author_id', 'language',
+    'retweet_count', 'like_count', 'reply_count', 'quote_count',
+    'sentiment_score', 'textblob_score', 'vader_score', 'confidence', 'subjectivity',
+    'collected_at'
+)
+
+# What get_tweet_sentiment returns by default
+DEFAULT_TWEET_SENTIMENT_COLUMNS = ('tweet_id', 'ticker', 'created_at', 'sentiment_score', 'confidence')
+
+# Totals over the daily summary rows (daily averages weighted by tweet count)
+SUMMARY_TOTALS_COLUMNS = '''
+        COALESCE(SUM(total_count), 0) as total_tweets,
+        SUM(average_sentiment * total_count) / SUM(total_count) as avg_sentiment,
+        COALESCE(SUM(positive_count), 0) as positive_count,
+        COALESCE(SUM(negative_count), 0) as negative_count,
+        COALESCE(SUM(neutral_count), 0) as neutral_count,
+        SUM(average_confidence * total_count) / SUM(total_count) as avg_confidence
+'''
+SENTIMENT_SUMMARY_SQL = '''
+    SELECT''' + SUMMARY_TOTALS_COLUMNS + '''
+    FROM sentiment_summary
+    WHERE ticker = ?
+    AND source = 'twitter'
+    AND date >= ?
+'''
+# Same totals for several tickers at once, one row per ticker.
+# {placeholders} is a run of "?, ?, ..." (one per ticker, never user text)
+SENTIMENT_SUMMARIES_SQL = '''
+    SELECT ticker,''' + SUMMARY_TOTALS_COLUMNS + '''
+    FROM sentiment_summary
+    WHERE ticker IN ({placeholders})
+    AND source = 'twitter'
+    AND date >= ?
+    GROUP BY ticker
+'''
+
+# SEC filings
+INSERT_FILING_SQL = '''
+    INSERT OR IGNORE INTO sec_filings (
+        ticker, cik, filing_type, filing_date, description, document_link
+    ) VALUES (?, ?, ?, ?, ?, ?)
+'''
+SELECT_FILINGS_SQL = '''
+    SELECT * FROM sec_filings
+    WHERE ticker = ?
+    ORDER BY filing_date DESC
+'''
+SELECT_FILINGS_BY_TYPE_SQL = '''
+    SELECT * FROM sec_filings
+    WHERE ticker = ? AND filing_type = ?
+    ORDER BY filing_date DESC
+'''
+
+# FMP institutional holdings and insider trades
+INSERT_HOLDING_SQL = '''
+    INSERT OR IGNORE INTO institutional_holdings (
+        ticker, holder, shares, date_reported, change, percent_held
+    ) VALUES (?, ?, ?, ?, ?, ?)
+'''
+SELECT_HOLDINGS_SQL = '''
+    SELECT * FROM institutional_holdings
+    WHERE ticker = ?
+    ORDER BY date_reported DESC
+'''
+INSERT_INSIDER_TRADE_SQL = '''
+    INSERT OR IGNORE INTO fmp_insider_trades (
+        ticker, filing_date, transaction_date, reporting_name,
+        transaction_type, securities_owned, securities_transacted, price
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def _to_unix_time(value: Any) -> int:
+    """
+    Convert a tweet timestamp to Unix time (whole seconds) for storage.
+
+    Args:
+        value: datetime (times without a timezone are taken as UTC),
+               ISO-8601 text, or a number that already is Unix time
+
+    Returns:
+        Seconds since 1970-01-01 UTC
+    """
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _fetch_dicts(conn: sqlite3.Connection, sql: str, params: tuple) -> List[Dict]:
+    """
+    Run a query and return every row as a dictionary.
+
+    Rows are fetched as plain tuples and zipped with the column names once,
+    which is cheaper than building a sqlite3.Row for each row and then
+    copying it into a dict.
+
+    Args:
+        conn: Connection to run the query on
+        sql: SELECT statement
+        params: Query parameters
+
+    Returns:
+        List of {column name: value} dictionaries
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(sql, params)
+
+    columns = [description[0] for description in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _add_summary_percentages(result: Dict) -> Dict:
+    """
+    Add positive/negative/neutral percentages to a summary row.
+
+    Args:
+        result: Summary dictionary with total_tweets and the three counts
+
+    Returns:
+        The same dictionary, with the *_percentage keys filled in
+    """
+    total = result['total_tweets'] or 1  # Avoid division by zero
+    result['positive_percentage'] = (result['positive_count'] / total) * 100
+    result['negative_percentage'] = (result['negative_count'] / total) * 100
+    result['neutral_percentage'] = (result['neutral_count'] / total) * 100
+    return result
+
 
 class DatabaseManager:
     """
@@ -45,6 +267,20 @@ class DatabaseManager:
         # Ensure the database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # One open connection per thread, reused for every call from that thread
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        # Switch the database file to write-ahead logging (WAL). This setting is
+        # stored in the file itself, so it only has to be done once.
+        # WAL lets readers keep reading while a write is in progress and makes
+        # each commit much cheaper. (An in-memory database can't use WAL.)
+        if str(self.db_path) != ':memory:':
+            conn = sqlite3.connect(self.db_path)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.close()
+
         # Create tables if they don't exist
         self.create_tables()
 
@@ -52,18 +288,91 @@ class DatabaseManager:
 
     def get_connection(self) -> sqlite3.Connection:
         """
-        Get a database connection.
+        Get the database connection for the current thread.
+
+        The connection is opened on the first call from each thread and then
+        kept open, so later calls don't pay for opening the file, reading the
+        schema and applying the settings again. Don't close it - call close()
+        when you are done with the database manager.
 
         Returns:
             SQLite connection object
 
         Note: SQLite connections should be created per-thread.
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._open_connection(self.db_path)
+            self._local.conn = conn
+        return conn
+
+    def get_read_connection(self) -> sqlite3.Connection:
+        """
+        Get a read-only database connection for the current thread.
+
+        The get_* query methods use this instead of get_connection(). With WAL
+        enabled, readers never wait for a writer (and never hold it up), so
+        reports can run while another thread is storing new data. The
+        connection is opened read-only, so it can't take a write lock by accident.
+
+        Returns:
+            SQLite connection object (read-only)
+        """
+        # An in-memory database only exists inside its one connection
+        if str(self.db_path) == ':memory:':
+            return self.get_connection()
+
+        conn = getattr(self._local, 'read_conn', None)
+        if conn is None:
+            conn = self._open_connection(self.db_path.resolve().as_uri() + '?mode=ro', uri=True)
+            self._local.read_conn = conn
+        return conn
+
+    def _open_connection(self, database: Any, uri: bool = False) -> sqlite3.Connection:
+        """
+        Open a new connection with the app's settings and remember it for close().
+
+        Args:
+            database: File path (or "file:" URI when uri=True)
+            uri: Whether database is a URI (used for read-only connections)
+
+        Returns:
+            SQLite connection object
+        """
+        # timeout: wait up to 5 seconds if another connection is writing
+        # check_same_thread=False only so close() can close it from any thread
+        conn = sqlite3.connect(
+            database,
+            timeout=5.0,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            uri=uri
+        )
         # This makes rows behave like dictionaries
         conn.row_factory = sqlite3.Row
+
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+
+        with self._connections_lock:
+            self._connections.append(conn)
         return conn
 
+    def close(self):
+        """
+        Close all database connections opened by this manager.
+
+        A later call to get_connection() or get_read_connection() opens a
+        fresh connection.
+        """
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        # Forget the closed connections in every thread
+        # (a new thread-local store starts out empty)
+        self._local = threading.local()
+
     def create_tables(self):
         """
         Create all necessary database tables.
@@ -83,7 +392,7 @@ class DatabaseManager:
                 tweet_id TEXT UNIQUE NOT NULL,
                 ticker TEXT NOT NULL,
                 text TEXT NOT NULL,
-                created_at TIMESTAMP NOT NULL,
+                created_at INTEGER NOT NULL,  -- Unix time (seconds, UTC)
                 author_id TEXT,
                 language TEXT,
                 retweet_count INTEGER DEFAULT 0,
@@ -95,8 +404,7 @@ class DatabaseManager:
                 vader_score REAL,
                 confidence REAL,
                 subjectivity REAL,
-                collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(tweet_id)
+                collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
 
@@ -124,6 +432,7 @@ class DatabaseManager:
                 date DATE NOT NULL,
                 source TEXT NOT NULL,
                 average_sentiment REAL,
+                average_confidence REAL,
                 positive_count INTEGER DEFAULT 0,
                 negative_count INTEGER DEFAULT 0,
                 neutral_count INTEGER DEFAULT 0,
@@ -166,19 +475,90 @@ class DatabaseManager:
         ''')
 
         # Create indexes for faster queries
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_tweets_ticker ON tweets(ticker)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_tweets_created ON tweets(created_at)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_filings_ticker ON sec_filings(ticker)')
+        # Tweets and filings are looked up by ticker and then a date range/order,
+        # so one index on (ticker, date) answers both parts of the query
+        cursor.execute(TWEETS_TICKER_CREATED_INDEX_SQL)
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_filings_ticker_type_date ON sec_filings(ticker, filing_type, filing_date DESC)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_filings_date ON sec_filings(filing_date)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_summary_ticker_date ON sentiment_summary(ticker, date)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_institutional_ticker ON institutional_holdings(ticker)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_fmp_insider_ticker ON fmp_insider_trades(ticker)')
 
+        # Older databases have single-column indexes that the ones above replace
+        cursor.execute('DROP INDEX IF EXISTS idx_tweets_ticker')
+        cursor.execute('DROP INDEX IF EXISTS idx_tweets_created')
+        cursor.execute('DROP INDEX IF EXISTS idx_filings_ticker')
+
+        # Databases created before average_confidence existed need the column added
+        summary_columns = {row['name'] for row in cursor.execute('PRAGMA table_info(sentiment_summary)')}
+        if 'average_confidence' not in summary_columns:
+            cursor.execute('ALTER TABLE sentiment_summary ADD COLUMN average_confidence REAL')
+
+        # Convert older databases to the current layout (only runs once per file)
+        schema_version = cursor.execute('PRAGMA user_version').fetchone()[0]
+        if schema_version < 1:
+            # Timestamp text -> Unix time (SQLite's strftime understands the
+            # "YYYY-MM-DD HH:MM:SS[.ffffff][+HH:MM]" text we used to store)
+            cursor.execute('''
+                UPDATE tweets
+                SET created_at = CAST(strftime('%s', created_at) AS INTEGER)
+                WHERE typeof(created_at) = 'text'
+            ''')
+            if cursor.rowcount:
+                logger.info(f"Converted {cursor.rowcount} tweet timestamps to Unix time")
+        if schema_version < SCHEMA_VERSION:
+            cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+        # Fill the daily summary from tweets stored before it was kept up to date
+        has_summary = cursor.execute('SELECT 1 FROM sentiment_summary LIMIT 1').fetchone()
+        has_tweets = cursor.execute('SELECT 1 FROM tweets LIMIT 1').fetchone()
+        if has_tweets and not has_summary:
+            cursor.execute(SUMMARY_ROLLUP_SQL, (0,))
+            logger.info("Built daily sentiment summary from stored tweets")
+
         conn.commit()
-        conn.close()
 
         logger.info("Database tables created/verified")
 
+    @contextmanager
+    def bulk_load(self, row_count: int):
+        """
+        Speed up loading many tweets by rebuilding the date index afterwards.
+
+        While the index exists, every inserted tweet also has to be added to
+        it. For a large load it is cheaper to drop the index, insert all rows,
+        and build the index once at the end. Rebuilding covers the whole
+        table though, so the index is only dropped when the load is at least
+        BULK_LOAD_MIN_ROWS rows and at least as big as the table already is.
+        Otherwise this does nothing.
+
+        The unique tweet_id index is never dropped, since INSERT OR IGNORE
+        needs it to skip duplicates.
+
+        Args:
+            row_count: How many tweets are about to be inserted
+
+        Example:
+            with db.bulk_load(len(pairs)):
+                db.insert_tweets_batch(pairs)
+        """
+        conn = self.get_connection()
+
+        # MAX(id) is a cheap stand-in for the number of stored tweets
+        stored_rows = conn.execute('SELECT COALESCE(MAX(id), 0) FROM tweets').fetchone()[0]
+        if row_count < BULK_LOAD_MIN_ROWS or row_count < stored_rows:
+            yield
+            return
+
+        with conn:
+            conn.execute('DROP INDEX IF EXISTS idx_tweets_ticker_created')
+        try:
+            yield
+        finally:
+            # Always put the index back, even if the load failed
+            with conn:
+                conn.execute(TWEETS_TICKER_CREATED_INDEX_SQL)
+
     def insert_tweet(self, tweet_data: Dict, sentiment_data: Dict) -> bool:
         """
         Insert a tweet with its sentiment analysis into the database.
@@ -188,63 +568,84 @@ class DatabaseManager:
             sentiment_data: Dictionary with sentiment scores (from SentimentAnalyzer)
 
         Returns:
-            True if successful, False otherwise
+            True if the tweet was added, False if it was already stored or on error
         """
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                INSERT OR IGNORE INTO tweets (
-                    tweet_id, ticker, text, created_at, author_id, language,
-                    retweet_count, like_count, reply_count, quote_count,
-                    sentiment_score, textblob_score, vader_score, confidence, subjectivity
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                str(tweet_data['id']),
-                tweet_data.get('ticker', ''),
-                tweet_data['text'],
-                tweet_data['created_at'],
-                tweet_data.get('author_id', ''),
-                tweet_data.get('language', ''),
-                tweet_data.get('retweet_count', 0),
-                tweet_data.get('like_count', 0),
-                tweet_data.get('reply_count', 0),
-                tweet_data.get('quote_count', 0),
-                sentiment_data['sentiment_score'],
-                sentiment_data['textblob_score'],
-                sentiment_data['vader_score'],
-                sentiment_data['confidence'],
-                sentiment_data['subjectivity']
-            ))
-
-            conn.commit()
-            conn.close()
-            return True
-
-        except sqlite3.IntegrityError:
-            # Tweet already exists
-            logger.debug(f"Tweet {tweet_data['id']} already in database")
-            return False
-        except Exception as e:
-            logger.error(f"Error inserting tweet: {e}")
-            return False
+        return self.insert_tweets_batch([(tweet_data, sentiment_data)]) == 1
 
     def insert_tweets_batch(self, tweets_with_sentiment: List[tuple]) -> int:
         """
         Insert multiple tweets at once (more efficient).
 
+        All rows are written with a single executemany() call and committed
+        in one transaction, so the database file is synced once for the whole
+        batch instead of once per tweet.
+
         Args:
             tweets_with_sentiment: List of tuples (tweet_data, sentiment_data)
 
+        The new tweets are also added to the daily sentiment_summary table
+        in the same transaction (see get_sentiment_summary).
+
         Returns:
-            Number of tweets successfully inserted
+            Number of tweets successfully inserted (tweets already in the
+            database are skipped and not counted)
         """
-        inserted_count = 0
-        for tweet_data, sentiment_data in tweets_with_sentiment:
-            if self.insert_tweet(tweet_data, sentiment_data):
-                inserted_count += 1
-        return inserted_count
+        if not tweets_with_sentiment:
+            return 0
+
+        try:
+            rows = [
+                (
+                    str(tweet_data['id']),
+                    tweet_data.get('ticker', ''),
+                    tweet_data['text'],
+                    _to_unix_time(tweet_data['created_at']),
+                    tweet_data.get('author_id', ''),
+                    tweet_data.get('language', ''),
+                    tweet_data.get('retweet_count', 0),
+                    tweet_data.get('like_count', 0),
+                    tweet_data.get('reply_count', 0),
+                    tweet_data.get('quote_count', 0),
+                    sentiment_data['sentiment_score'],
+                    sentiment_data['textblob_score'],
+                    sentiment_data['vader_score'],
+                    sentiment_data['confidence'],
+                    sentiment_data['subjectivity']
+                )
+                for tweet_data, sentiment_data in tweets_with_sentiment
+            ]
+
+            conn = self.get_connection()
+            # "with conn" commits if everything worked, or rolls back on an error
+            with conn:
+                cursor = conn.cursor()
+
+                # Take the write lock before reading MAX(id). Otherwise another
+                # connection could commit tweets between this read and our
+                # INSERT, and the roll-up below would count them a second time.
+                cursor.execute('BEGIN IMMEDIATE')
+
+                # Every row inserted below gets an id above this one
+                last_id = cursor.execute('SELECT COALESCE(MAX(id), 0) FROM tweets').fetchone()[0]
+
+                # INSERT OR IGNORE skips tweets that are already stored
+                cursor.executemany(INSERT_TWEET_SQL, rows)
+
+                # rowcount is the number of rows actually inserted
+                inserted_count = cursor.rowcount
+
+                # Add just the new tweets to the daily summary
+                if inserted_count:
+                    cursor.execute(SUMMARY_ROLLUP_SQL, (last_id,))
+
+            skipped = len(rows) - inserted_count
+            if skipped:
+                logger.debug(f"{skipped} tweets already in database")
+            return inserted_count
+
+        except Exception as e:
+            logger.error(f"Error inserting tweets: {e}")
+            return 0
 
     def insert_sec_filing(self, filing_data: Dict) -> bool:
         """
@@ -254,63 +655,78 @@ class DatabaseManager:
             filing_data: Dictionary with filing information
 
         Returns:
-            True if successful, False otherwise
+            True if the filing was added, False if it was already stored or on error
         """
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                INSERT OR IGNORE INTO sec_filings (
-                    ticker, cik, filing_type, filing_date, description, document_link
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                filing_data['ticker'],
-                filing_data['cik'],
-                filing_data['filing_type'],
-                filing_data['filing_date'],
-                filing_data.get('description', ''),
-                filing_data.get('document_link', '')
-            ))
-
-            conn.commit()
-            conn.close()
+            # "with conn" commits if everything worked, or rolls back on an error
+            with conn:
+                cursor = conn.cursor()
+
+                cursor.execute(INSERT_FILING_SQL, (
+                    filing_data['ticker'],
+                    filing_data['cik'],
+                    filing_data['filing_type'],
+                    filing_data['filing_date'],
+                    filing_data.get('description', ''),
+                    filing_data.get('document_link', '')
+                ))
+
+            # INSERT OR IGNORE doesn't raise for duplicates - it just inserts nothing
+            if cursor.rowcount == 0:
+                logger.debug(f"Filing already exists: {filing_data['ticker']} {filing_data['filing_type']} {filing_data['filing_date']}")
+                return False
             return True
 
-        except sqlite3.IntegrityError:
-            logger.debug(f"Filing already exists: {filing_data['ticker']} {filing_data['filing_type']} {filing_data['filing_date']}")
-            return False
         except Exception as e:
             logger.error(f"Error inserting SEC filing: {e}")
             return False
 
-    def get_tweet_sentiment(self, ticker: str, days: int = 7) -> List[Dict]:
+    def get_tweet_sentiment(
+        self,
+        ticker: str,
+        days: int = 7,
+        columns: Sequence[str] = DEFAULT_TWEET_SENTIMENT_COLUMNS
+    ) -> List[Dict]:
         """
         Get recent tweet sentiment for a ticker.
 
+        Only the requested columns are read, so SQLite doesn't have to decode
+        (and Python doesn't have to copy) the tweet text and other fields that
+        most callers never look at.
+
         Args:
             ticker: Stock ticker symbol
             days: Number of days of history to retrieve
+            columns: Which columns to return (any of TWEET_COLUMNS),
+                     e.g. columns=TWEET_COLUMNS for the full records
 
         Returns:
-            List of tweet records with sentiment
+            List of tweet records with sentiment. created_at is Unix time in
+            seconds; use datetime.fromtimestamp(value, timezone.utc) to turn
+            it back into a datetime.
         """
+        unknown = set(columns) - set(TWEET_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown tweet columns: {sorted(unknown)}")
+
         try:
-            conn = self.get_connection()
+            # Work out the cutoff time here and pass it in as a plain value, so
+            # SQLite can use it directly as the start of the index range
+            # (created_at is stored as Unix time)
+            cutoff = int((datetime.now(timezone.utc) - timedelta(days=days)).timestamp())
+
+            conn = self.get_read_connection()
             cursor = conn.cursor()
+            # Plain tuples are cheaper to build than sqlite3.Row objects
+            cursor.row_factory = None
 
-            cursor.execute('''
-                SELECT * FROM tweets
-                WHERE ticker = ?
-                AND created_at >= datetime('now', '-' || ? || ' days')
-                ORDER BY created_at DESC
-            ''', (ticker, days))
+            cursor.execute(SELECT_TWEETS_SQL.format(columns=', '.join(columns)), (ticker, cutoff))
 
             rows = cursor.fetchall()
-            conn.close()
 
             # Convert to list of dictionaries
-            return [dict(row) for row in rows]
+            return [dict(zip(columns, row)) for row in rows]
 
         except Exception as e:
             logger.error(f"Error querying tweets: {e}")
@@ -320,6 +736,10 @@ class DatabaseManager:
         """
         Get aggregated sentiment summary for a ticker.
 
+        Reads the daily totals from the sentiment_summary table (one row per
+        day) instead of going through every tweet. Days are whole calendar
+        days (UTC), so "days=7" covers today plus the 7 days before it.
+
         Args:
             ticker: Stock ticker symbol
             days: Number of days to aggregate
@@ -328,32 +748,18 @@ class DatabaseManager:
             Dictionary with sentiment statistics
         """
         try:
-            conn = self.get_connection()
+            # First day to include, as 'YYYY-MM-DD' (like SQLite's date())
+            cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d')
+
+            conn = self.get_read_connection()
             cursor = conn.cursor()
 
-            cursor.execute('''
-                SELECT
-                    COUNT(*) as total_tweets,
-                    AVG(sentiment_score) as avg_sentiment,
-                    SUM(CASE WHEN sentiment_score > 0.05 THEN 1 ELSE 0 END) as positive_count,
-                    SUM(CASE WHEN sentiment_score < -0.05 THEN 1 ELSE 0 END) as negative_count,
-                    SUM(CASE WHEN sentiment_score BETWEEN -0.05 AND 0.05 THEN 1 ELSE 0 END) as neutral_count,
-                    AVG(confidence) as avg_confidence
-                FROM tweets
-                WHERE ticker = ?
-                AND created_at >= datetime('now', '-' || ? || ' days')
-            ''', (ticker, days))
+            cursor.execute(SENTIMENT_SUMMARY_SQL, (ticker, cutoff))
 
             row = cursor.fetchone()
-            conn.close()
 
-            if row:
-                result = dict(row)
-                total = result['total_tweets'] or 1  # Avoid division by zero
-                result['positive_percentage'] = (result['positive_count'] / total) * 100
-                result['negative_percentage'] = (result['negative_count'] / total) * 100
-                result['neutral_percentage'] = (result['neutral_count'] / total) * 100
-                return result
+            if row and row['total_tweets']:
+                return _add_summary_percentages(dict(row))
             else:
                 return {}
 
@@ -361,6 +767,58 @@ class DatabaseManager:
             logger.error(f"Error getting sentiment summary: {e}")
             return {}
 
+    def get_sentiment_summaries(self, tickers: Sequence[str], days: int = 30) -> Dict[str, Dict]:
+        """
+        Get aggregated sentiment summaries for several tickers in one query.
+
+        Returns the same numbers as calling get_sentiment_summary once per
+        ticker, but with a single trip to the database (grouped by ticker).
+
+        Args:
+            tickers: Stock ticker symbols
+            days: Number of days to aggregate
+
+        Returns:
+            Dictionary mapping ticker -> summary dictionary.
+            Tickers without any tweets are left out.
+        """
+        if not tickers:
+            return {}
+
+        try:
+            # First day to include, as 'YYYY-MM-DD' (like SQLite's date())
+            cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d')
+
+            sql = SENTIMENT_SUMMARIES_SQL.format(placeholders=', '.join('?' * len(tickers)))
+            rows = _fetch_dicts(self.get_read_connection(), sql, (*tickers, cutoff))
+
+            return {
+                row.pop('ticker'): _add_summary_percentages(row)
+                for row in rows
+                if row['total_tweets']
+            }
+
+        except Exception as e:
+            logger.error(f"Error getting sentiment summaries: {e}")
+            return {}
+
+    def get_data_version(self) -> int:
+        """
+        Get a number that changes whenever tweets are added.
+
+        This is the highest tweet row id. It is cheap to read and lets callers
+        tell whether cached summaries are still up to date.
+
+        Returns:
+            Highest tweets.id (0 if the table is empty or on error)
+        """
+        try:
+            conn = self.get_read_connection()
+            return conn.execute('SELECT COALESCE(MAX(id), 0) FROM tweets').fetchone()[0]
+        except Exception as e:
+            logger.error(f"Error getting data version: {e}")
+            return 0
+
     def get_sec_filings(self, ticker: str, filing_type: Optional[str] = None) -> List[Dict]:
         """
         Get SEC filings for a ticker.
@@ -373,26 +831,11 @@ class DatabaseManager:
             List of filing records
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            conn = self.get_read_connection()
 
             if filing_type:
-                cursor.execute('''
-                    SELECT * FROM sec_filings
-                    WHERE ticker = ? AND filing_type = ?
-                    ORDER BY filing_date DESC
-                ''', (ticker, filing_type))
-            else:
-                cursor.execute('''
-                    SELECT * FROM sec_filings
-                    WHERE ticker = ?
-                    ORDER BY filing_date DESC
-                ''', (ticker,))
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            return [dict(row) for row in rows]
+                return _fetch_dicts(conn, SELECT_FILINGS_BY_TYPE_SQL, (ticker, filing_type))
+            return _fetch_dicts(conn, SELECT_FILINGS_SQL, (ticker,))
 
         except Exception as e:
             logger.error(f"Error querying SEC filings: {e}")
@@ -410,23 +853,19 @@ class DatabaseManager:
         """
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
+            # "with conn" commits if everything worked, or rolls back on an error
+            with conn:
+                cursor = conn.cursor()
+
+                cursor.execute(INSERT_HOLDING_SQL, (
+                    holding_data['ticker'],
+                    holding_data.get('holder', ''),
+                    holding_data.get('shares', 0),
+                    holding_data.get('dateReported', None),
+                    holding_data.get('change', 0),
+                    holding_data.get('percentHeld', 0.0)
+                ))
 
-            cursor.execute('''
-                INSERT OR IGNORE INTO institutional_holdings (
-                    ticker, holder, shares, date_reported, change, percent_held
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                holding_data['ticker'],
-                holding_data.get('holder', ''),
-                holding_data.get('shares', 0),
-                holding_data.get('dateReported', None),
-                holding_data.get('change', 0),
-                holding_data.get('percentHeld', 0.0)
-            ))
-
-            conn.commit()
-            conn.close()
             return True
 
         except Exception as e:
@@ -445,26 +884,21 @@ class DatabaseManager:
         """
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
+            # "with conn" commits if everything worked, or rolls back on an error
+            with conn:
+                cursor = conn.cursor()
+
+                cursor.execute(INSERT_INSIDER_TRADE_SQL, (
+                    trade_data.get('symbol', trade_data.get('ticker', '')),
+                    trade_data.get('filingDate', None),
+                    trade_data.get('transactionDate', None),
+                    trade_data.get('reportingName', ''),
+                    trade_data.get('transactionType', ''),
+                    trade_data.get('securitiesOwned', 0),
+                    trade_data.get('securitiesTransacted', 0),
+                    trade_data.get('price', 0.0)
+                ))
 
-            cursor.execute('''
-                INSERT OR IGNORE INTO fmp_insider_trades (
-                    ticker, filing_date, transaction_date, reporting_name,
-                    transaction_type, securities_owned, securities_transacted, price
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                trade_data.get('symbol', trade_data.get('ticker', '')),
-                trade_data.get('filingDate', None),
-                trade_data.get('transactionDate', None),
-                trade_data.get('reportingName', ''),
-                trade_data.get('transactionType', ''),
-                trade_data.get('securitiesOwned', 0),
-                trade_data.get('securitiesTransacted', 0),
-                trade_data.get('price', 0.0)
-            ))
-
-            conn.commit()
-            conn.close()
             return True
 
         except Exception as e:
@@ -482,19 +916,9 @@ class DatabaseManager:
             List of institutional holding records
         """
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
+            conn = self.get_read_connection()
 
-            cursor.execute('''
-                SELECT * FROM institutional_holdings
-                WHERE ticker = ?
-                ORDER BY date_reported DESC
-            ''', (ticker,))
-
-            rows = cursor.fetchall()
-            conn.close()
-
-            return [dict(row) for row in rows]
+            return _fetch_dicts(conn, SELECT_HOLDINGS_SQL, (ticker,))
 
         except Exception as e:
             logger.error(f"Error querying institutional holdings: {e}")
@@ -506,6 +930,8 @@ if __name__ == "__main__":
     """
     Test the database manager.
     """
+    logging.basicConfig(level=logging.INFO)
+
     print("\n=== Testing Database Manager ===\n")
 
     # Create database instance
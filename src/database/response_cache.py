@@ -0,0 +1,115 @@
+"""
+Response Cache Module
+Stores API responses on disk so repeated requests can be answered without
+going back to the network.
+
+Uses a small SQLite file (separate from the main sentiment database).
+Every entry has an expiry time, so slow-changing data (like quarterly 13F
+holdings) can be kept for a long time while fast-changing data expires sooner.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    A persistent key/value cache with per-entry expiry (TTL).
+
+    Values must be JSON-serializable (API responses usually are).
+    The cache is safe to share between threads.
+
+    Example:
+        cache = ResponseCache(Config.DATA_DIR / 'fmp_cache.db')
+        key = cache.make_key('/institutional-holder/AAPL')
+        data = cache.get(key)
+        if data is None:
+            data = fetch_from_api()
+            cache.set(key, data, ttl=3600)
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Open (or create) the cache file.
+
+        Args:
+            db_path: Path to the SQLite file used for the cache
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One shared connection, serialized with a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        ''')
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a cache key from any number of hashable parts.
+
+        Args:
+            parts: Values that identify the request (endpoint, params, ...)
+
+        Returns:
+            Short hex digest that is safe to use as a key
+        """
+        return hashlib.blake2b(repr(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key (see make_key)
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT value, expires_at FROM cache WHERE key = ?', (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Cache read failed: {e}")
+            return None
+
+        if row is None or row[1] < time.time():
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float):
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key (see make_key)
+            value: JSON-serializable value to store
+            ttl: Time to live in seconds
+        """
+        try:
+            with self._lock:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)',
+                    (key, json.dumps(value), time.time() + ttl)
+                )
+                self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Cache write failed: {e}")
@@ -8,6 +8,7 @@ Usage:
 
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 import sys
@@ -53,6 +54,9 @@ class SentimentApp:
             logger.error("Please set up your .env file before running the app")
             sys.exit(1)
 
+        # Make sure the data/ and logs/ directories exist
+        Config.create_directories()
+
         # Initialize components
         self.twitter = TwitterCollector()
         self.sec = SECEdgarCollector()
@@ -85,7 +89,7 @@ class SentimentApp:
 
         # Step 2: Analyze sentiment for each tweet
         logger.info("Analyzing sentiment...")
-        analyzed_count = 0
+        pairs = []
 
         for tweet in tweets:
             # Analyze the tweet text
@@ -94,14 +98,15 @@ class SentimentApp:
             # Add ticker to tweet data
             tweet['ticker'] = ticker
 
-            # Store in database
-            success = self.db.insert_tweet(tweet, sentiment)
-            if success:
-                analyzed_count += 1
+            pairs.append((tweet, sentiment.to_dict()))
+
+        # Step 3: Store all tweets in the database in one transaction
+        with self.db.bulk_load(len(pairs)):
+            analyzed_count = self.db.insert_tweets_batch(pairs)
 
         logger.info(f"Stored {analyzed_count} new tweets in database")
 
-        # Step 3: Get overall sentiment summary
+        # Step 4: Get overall sentiment summary
         summary = self.db.get_sentiment_summary(ticker, days=7)
 
         return summary
@@ -301,15 +306,27 @@ Examples:
     # Create app instance
     app = SentimentApp()
 
-    # Analyze each ticker
-    for ticker in args.ticker:
-        try:
-            results = app.analyze_stock(ticker.upper(), max_tweets=args.tweets)
-            app.display_results(results)
-        except Exception as e:
-            logger.error(f"Error analyzing {ticker}: {e}")
-            import traceback
-            traceback.print_exc()
+    # Analyze the tickers in parallel - most of the time is spent waiting on
+    # the Twitter and SEC APIs, so several tickers can wait at once.
+    # Each report is printed as soon as its ticker is done.
+    # The threads share one DatabaseManager (a connection per thread); each
+    # tweet batch is inserted and added to the daily summary under SQLite's
+    # write lock, so parallel tickers can't double-count each other's tweets.
+    tickers = [ticker.upper() for ticker in args.ticker]
+    with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as executor:
+        futures = {
+            executor.submit(app.analyze_stock, ticker, max_tweets=args.tweets): ticker
+            for ticker in tickers
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                results = future.result()
+                app.display_results(results)
+            except Exception as e:
+                logger.error(f"Error analyzing {ticker}: {e}")
+                import traceback
+                traceback.print_exc()
 
     logger.info("Analysis complete!")
 
@@ -3,21 +3,57 @@ Sentiment Visualization Module
 Creates charts and graphs to visualize sentiment data.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from datetime import datetime, timedelta
-from typing import List, Dict
+import functools
+import io
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, TYPE_CHECKING
 import logging
 from pathlib import Path
-import sys
+from collections import OrderedDict
+
+# Import our configuration
+# The project root is only added to sys.path when this file is run directly
+# as a script; normal imports (e.g. from src/main.py) leave sys.path alone.
+try:
+    from config.config import Config
+except ImportError:
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+    from config.config import Config
+
+# matplotlib, numpy and the database module are imported when first needed,
+# so importing this module stays fast for code that doesn't draw anything
+if TYPE_CHECKING:
+    from src.database.db_manager import DatabaseManager
+
+# Charts only open in a window when asked for (SENTIMENT_SHOW=1, or --show
+# when running this file). Otherwise use the non-interactive Agg backend,
+# which draws straight to image files without starting a GUI.
+SHOW_PLOTS = os.environ.get('SENTIMENT_SHOW') == '1' or (
+    __name__ == "__main__" and '--show' in sys.argv
+)
+
+# Set up logging (the app configures handlers; see src/main.py)
+logger = logging.getLogger(__name__)
 
-# Add project root to path
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.database.db_manager import DatabaseManager
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+@functools.lru_cache(maxsize=None)
+def _pyplot():
+    """
+    Import matplotlib.pyplot the first time a chart is needed.
+
+    The backend is picked here, just before pyplot is loaded.
+
+    Returns:
+        The matplotlib.pyplot module
+    """
+    import matplotlib
+    if not SHOW_PLOTS:
+        matplotlib.use('Agg')
+
+    import matplotlib.pyplot as plt
+    return plt
 
 
 class SentimentVisualizer:
@@ -30,53 +66,128 @@ class SentimentVisualizer:
     - Comparison charts for multiple tickers
     """
 
-    def __init__(self, db_manager: DatabaseManager = None):
+    # Colors and labels shared by every chart (built once, not per call)
+    POSITIVE_COLOR = '#2ecc71'  # Green
+    NEUTRAL_COLOR = '#95a5a6'   # Gray
+    NEGATIVE_COLOR = '#e74c3c'  # Red
+
+    _PIE_LABELS = ('Positive', 'Neutral', 'Negative')
+    _PIE_COLORS = (POSITIVE_COLOR, NEUTRAL_COLOR, NEGATIVE_COLOR)
+    _PIE_EXPLODE = (0.1, 0, 0)  # Slightly separate the positive slice
+
+    # With fewer tweets than this the distribution is drawn as simple bars
+    MIN_TWEETS_FOR_PIE = 10
+
+    # How many saved chart images to keep in memory (see _save_figure)
+    RENDER_CACHE_SIZE = 64
+
+    def __init__(self, db_manager: 'DatabaseManager' = None):
         """
         Initialize the visualizer.
 
         Args:
             db_manager: Database manager instance (creates new one if not provided)
         """
-        self.db = db_manager or DatabaseManager()
+        if db_manager is None:
+            from src.database.db_manager import DatabaseManager
+            db_manager = DatabaseManager()
+        self.db = db_manager
+        # Summaries already fetched by the plot methods (see _get_summary)
+        self._cached_summary = functools.lru_cache(maxsize=256)(self._load_summary)
+        # Figure and artists of the live gauge (see start_live_gauge)
+        self._live_gauge = None
+        # Encoded images of recently saved charts, oldest first
+        self._render_cache = OrderedDict()
         # Set a nice style for plots
+        plt = _pyplot()
         plt.style.use('seaborn-v0_8-darkgrid' if 'seaborn-v0_8-darkgrid' in plt.style.available else 'default')
 
+    def _get_summary(self, ticker: str, days: int) -> Dict:
+        """
+        Get a sentiment summary, reusing the last result when nothing changed.
+
+        Plotting the same ticker twice (e.g. distribution and then gauge)
+        only queries the database once. The cache key includes the database's
+        data version and today's date, so new tweets or a new day give fresh
+        numbers.
+
+        Args:
+            ticker: Stock ticker symbol
+            days: Number of days to aggregate
+
+        Returns:
+            Sentiment summary dictionary (do not modify it - it is shared)
+        """
+        today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+        return self._cached_summary(ticker, days, today, self.db.get_data_version())
+
+    def _load_summary(self, ticker: str, days: int, today: str, version: int) -> Dict:
+        """Query the summary (today and version are only part of the cache key)."""
+        return self.db.get_sentiment_summary(ticker, days=days)
+
     def plot_sentiment_distribution(self, ticker: str, days: int = 7, save_path: str = None):
         """
         Create a pie chart showing the distribution of positive/negative/neutral sentiment.
 
+        With only a handful of tweets (fewer than MIN_TWEETS_FOR_PIE) a pie
+        chart says little, so plain horizontal bars with the counts are drawn
+        instead.
+
         Args:
             ticker: Stock ticker symbol
             days: Number of days of data to include
-            save_path: Optional path to save the figure
+            save_path: Optional path (or binary file object) to save the figure
         """
+        if not self._has_output(save_path):
+            return
+
         # Get sentiment summary from database
-        summary = self.db.get_sentiment_summary(ticker, days=days)
+        summary = self._get_summary(ticker, days)
 
         if not summary or summary.get('total_tweets', 0) == 0:
             logger.warning(f"No data available for {ticker}")
             return
 
-        # Create pie chart
-        labels = ['Positive', 'Neutral', 'Negative']
+        # Same numbers as a chart we saved recently: reuse that image
+        render_key = ('distribution', ticker, days, tuple(sorted(summary.items())))
+        if self._save_cached_render(render_key, save_path):
+            return
+
         sizes = [
             summary['positive_count'],
             summary['neutral_count'],
             summary['negative_count']
         ]
-        colors = ['#2ecc71', '#95a5a6', '#e74c3c']  # Green, Gray, Red
-        explode = (0.1, 0, 0)  # Slightly separate the positive slice
 
+        plt = _pyplot()
         fig, ax = plt.subplots(figsize=(10, 7))
-        ax.pie(sizes, explode=explode, labels=labels, colors=colors,
-               autopct='%1.1f%%', shadow=True, startangle=90)
+
+        if summary['total_tweets'] < self.MIN_TWEETS_FOR_PIE:
+            # Too few tweets for a meaningful pie: show the counts as bars
+            from matplotlib.ticker import MaxNLocator
+            ax.barh(self._PIE_LABELS, sizes, color=self._PIE_COLORS)
+            ax.invert_yaxis()  # Positive on top, like the pie's legend order
+            ax.xaxis.set_major_locator(MaxNLocator(integer=True))
+            ax.set_xlabel('Count', fontsize=12)
+            # Leave room at the bottom for the summary text below
+            layout_rect = (0, 0.12, 1, 1)
+        else:
+            # Create pie chart (no drop shadow - it doubles the shapes drawn).
+            # Percentages are formatted once here and shown in the wedge
+            # labels, instead of matplotlib adding a second text per wedge.
+            total = sum(sizes)
+            pie_labels = [f'{label}\n{size / total * 100:.1f}%'
+                          for label, size in zip(self._PIE_LABELS, sizes)]
+            ax.pie(sizes, explode=self._PIE_EXPLODE, labels=pie_labels, colors=self._PIE_COLORS,
+                   startangle=90)
+
+            # Equal aspect ratio ensures that pie is drawn as a circle
+            ax.axis('equal')
+            layout_rect = (0, 0, 1, 1)
 
         ax.set_title(f'{ticker} Sentiment Distribution\n(Last {days} days, {summary["total_tweets"]} tweets)',
                      fontsize=16, fontweight='bold')
 
-        # Equal aspect ratio ensures that pie is drawn as a circle
-        ax.axis('equal')
-
         # Add summary text
         avg_sentiment = summary.get('avg_sentiment', 0)
         sentiment_label = self._classify_sentiment(avg_sentiment)
@@ -88,13 +199,15 @@ class SentimentVisualizer:
         plt.figtext(0.5, 0.02, text_str, ha='center', fontsize=10,
                    bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
-        plt.tight_layout()
+        plt.tight_layout(rect=layout_rect)
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            logger.info(f"Saved chart to {save_path}")
+            self._save_figure(fig, save_path, render_key)
 
-        plt.show()
+        # Free the figure right away unless it is being shown on screen
+        if SHOW_PLOTS:
+            plt.show()
+        plt.close(fig)
 
     def plot_sentiment_gauge(self, ticker: str, days: int = 7, save_path: str = None):
         """
@@ -103,53 +216,161 @@ class SentimentVisualizer:
         Args:
             ticker: Stock ticker symbol
             days: Number of days of data to include
-            save_path: Optional path to save the figure
+            save_path: Optional path (or binary file object) to save the figure
         """
-        summary = self.db.get_sentiment_summary(ticker, days=days)
+        if not self._has_output(save_path):
+            return
+
+        summary = self._get_summary(ticker, days)
 
         if not summary or summary.get('total_tweets', 0) == 0:
             logger.warning(f"No data available for {ticker}")
             return
 
+        render_key = ('gauge', ticker, days, tuple(sorted(summary.items())))
+        if self._save_cached_render(render_key, save_path):
+            return
+
         sentiment_score = summary.get('avg_sentiment', 0)
 
         # Create figure
+        plt = _pyplot()
         fig, ax = plt.subplots(figsize=(10, 6))
+        self._draw_gauge_static(ax)
+        ax.set_title(f'{ticker} Sentiment Gauge\n(Last {days} days, {summary["total_tweets"]} tweets)',
+                     fontsize=16, fontweight='bold')
 
-        # Create the gauge background
-        ax.barh([0], [2], left=[-1], height=0.3, color='#e74c3c', alpha=0.3)  # Negative (red)
-        ax.barh([0], [0.1], left=[-0.05], height=0.3, color='#95a5a6', alpha=0.3)  # Neutral (gray)
-        ax.barh([0], [1], left=[0.05], height=0.3, color='#2ecc71', alpha=0.3)  # Positive (green)
+        # Add the sentiment indicator and score text
+        ax.plot([sentiment_score], [0], 'o', markersize=20,
+                color=self._gauge_color(sentiment_score), zorder=5)
+        ax.text(sentiment_score, 0.25, self._gauge_text(sentiment_score),
+                ha='center', va='bottom', fontsize=12, fontweight='bold')
+
+        plt.tight_layout()
+
+        if save_path:
+            self._save_figure(fig, save_path, render_key)
+
+        # Free the figure right away unless it is being shown on screen
+        if SHOW_PLOTS:
+            plt.show()
+        plt.close(fig)
+
+    def start_live_gauge(self, ticker: str, days: int = 7):
+        """
+        Open a gauge that can be updated cheaply with update_gauge().
+
+        The parts that never change (colored bands, labels, axes) are drawn
+        once and saved as a background image. Each update only redraws the
+        marker and the score text on top of it ("blitting"), instead of
+        redrawing the whole chart.
+
+        Args:
+            ticker: Stock ticker symbol (used for the title and first score)
+            days: Number of days of data for the first score
+
+        Returns:
+            The gauge's matplotlib figure
+        """
+        self.stop_live_gauge()
+
+        summary = self._get_summary(ticker, days)
+        sentiment_score = summary.get('avg_sentiment') or 0
+
+        plt = _pyplot()
+        fig, ax = plt.subplots(figsize=(10, 6))
+        self._draw_gauge_static(ax)
+        ax.set_title(f'{ticker} Sentiment Gauge (live)', fontsize=16, fontweight='bold')
+        plt.tight_layout()
+
+        # The moving parts are "animated": left out of normal draws so the
+        # saved background doesn't contain them
+        marker, = ax.plot([0], [0], 'o', markersize=20, zorder=5, animated=True)
+        text = ax.text(0, 0.25, '', ha='center', va='bottom', fontsize=12,
+                       fontweight='bold', animated=True)
+
+        if SHOW_PLOTS:
+            plt.show(block=False)
+        fig.canvas.draw()
+
+        self._live_gauge = {
+            'fig': fig,
+            'ax': ax,
+            'marker': marker,
+            'text': text,
+            'background': fig.canvas.copy_from_bbox(ax.bbox),
+        }
+        self.update_gauge(sentiment_score)
+        return fig
+
+    def update_gauge(self, score: float):
+        """
+        Move the live gauge (see start_live_gauge) to a new score.
+
+        Args:
+            score: Sentiment score from -1 to 1
+        """
+        gauge = self._live_gauge
+        if gauge is None:
+            logger.warning("No live gauge open - call start_live_gauge() first")
+            return
+
+        canvas = gauge['fig'].canvas
+        ax = gauge['ax']
+
+        # Put back the saved background, then draw only the moving parts
+        canvas.restore_region(gauge['background'])
 
-        # Add the sentiment indicator
-        color = '#e74c3c' if sentiment_score < -0.05 else '#2ecc71' if sentiment_score > 0.05 else '#95a5a6'
-        ax.plot([sentiment_score], [0], 'o', markersize=20, color=color, zorder=5)
+        gauge['marker'].set_data([score], [0])
+        gauge['marker'].set_color(self._gauge_color(score))
+        gauge['text'].set_position((score, 0.25))
+        gauge['text'].set_text(self._gauge_text(score))
+
+        ax.draw_artist(gauge['marker'])
+        ax.draw_artist(gauge['text'])
+        canvas.blit(ax.bbox)
+        canvas.flush_events()
+
+    def stop_live_gauge(self):
+        """Close the live gauge, if one is open."""
+        if self._live_gauge is not None:
+            _pyplot().close(self._live_gauge['fig'])
+            self._live_gauge = None
+
+    def _draw_gauge_static(self, ax):
+        """
+        Draw the parts of the gauge that don't depend on the score.
+
+        Args:
+            ax: Axes to draw on
+        """
+        # Create the gauge background
+        ax.barh([0], [2], left=[-1], height=0.3, color=self.NEGATIVE_COLOR, alpha=0.3)
+        ax.barh([0], [0.1], left=[-0.05], height=0.3, color=self.NEUTRAL_COLOR, alpha=0.3)
+        ax.barh([0], [1], left=[0.05], height=0.3, color=self.POSITIVE_COLOR, alpha=0.3)
 
         # Formatting
         ax.set_xlim(-1, 1)
         ax.set_ylim(-0.5, 0.5)
         ax.set_yticks([])
         ax.set_xlabel('Sentiment Score', fontsize=12)
-        ax.set_title(f'{ticker} Sentiment Gauge\n(Last {days} days, {summary["total_tweets"]} tweets)',
-                     fontsize=16, fontweight='bold')
 
         # Add labels
-        ax.text(-0.5, -0.3, 'Negative', ha='center', fontsize=10, color='#e74c3c')
-        ax.text(0, -0.3, 'Neutral', ha='center', fontsize=10, color='#95a5a6')
-        ax.text(0.5, -0.3, 'Positive', ha='center', fontsize=10, color='#2ecc71')
-
-        # Add score text
-        sentiment_label = self._classify_sentiment(sentiment_score)
-        ax.text(sentiment_score, 0.25, f'{sentiment_score:.3f}\n{sentiment_label}',
-                ha='center', va='bottom', fontsize=12, fontweight='bold')
-
-        plt.tight_layout()
-
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            logger.info(f"Saved chart to {save_path}")
-
-        plt.show()
+        ax.text(-0.5, -0.3, 'Negative', ha='center', fontsize=10, color=self.NEGATIVE_COLOR)
+        ax.text(0, -0.3, 'Neutral', ha='center', fontsize=10, color=self.NEUTRAL_COLOR)
+        ax.text(0.5, -0.3, 'Positive', ha='center', fontsize=10, color=self.POSITIVE_COLOR)
+
+    def _gauge_color(self, score: float) -> str:
+        """Marker color for a score (green / gray / red)."""
+        if score < -0.05:
+            return self.NEGATIVE_COLOR
+        if score > 0.05:
+            return self.POSITIVE_COLOR
+        return self.NEUTRAL_COLOR
+
+    def _gauge_text(self, score: float) -> str:
+        """Score text shown above the gauge marker."""
+        return f'{score:.3f}\n{self._classify_sentiment(score)}'
 
     def plot_sentiment_comparison(self, tickers: List[str], days: int = 7, save_path: str = None):
         """
@@ -158,39 +379,47 @@ class SentimentVisualizer:
         Args:
             tickers: List of stock ticker symbols
             days: Number of days of data to include
-            save_path: Optional path to save the figure
+            save_path: Optional path (or binary file object) to save the figure
         """
-        # Collect data for all tickers
-        data = []
-        for ticker in tickers:
-            summary = self.db.get_sentiment_summary(ticker, days=days)
-            if summary and summary.get('total_tweets', 0) > 0:
-                data.append({
-                    'ticker': ticker,
-                    'sentiment': summary.get('avg_sentiment', 0),
-                    'tweets': summary.get('total_tweets', 0)
-                })
-
-        if not data:
+        if not self._has_output(save_path):
+            return
+
+        import numpy as np
+
+        # Collect data for all tickers (one query for the whole list),
+        # kept as parallel columns: ticker names, scores and tweet counts
+        summaries = self.db.get_sentiment_summaries(tickers, days=days)
+        tickers_list = [ticker for ticker in tickers if ticker in summaries]
+
+        if not tickers_list:
             logger.warning("No data available for any ticker")
             return
 
+        render_key = ('comparison', days,
+                      tuple((t, tuple(sorted(summaries[t].items()))) for t in tickers_list))
+        if self._save_cached_render(render_key, save_path):
+            return
+
+        sentiments = np.fromiter((summaries[t]['avg_sentiment'] or 0 for t in tickers_list),
+                                 dtype=np.float64, count=len(tickers_list))
+        tweet_counts = np.fromiter((summaries[t]['total_tweets'] for t in tickers_list),
+                                   dtype=np.int64, count=len(tickers_list))
+
         # Create bar chart
+        plt = _pyplot()
         fig, ax = plt.subplots(figsize=(12, 6))
 
-        tickers_list = [d['ticker'] for d in data]
-        sentiments = [d['sentiment'] for d in data]
-        colors = ['#2ecc71' if s > 0.05 else '#e74c3c' if s < -0.05 else '#95a5a6' for s in sentiments]
+        # Pick every bar color in one vectorized pass (green / red / gray)
+        colors = np.select([sentiments > 0.05, sentiments < -0.05],
+                           [self.POSITIVE_COLOR, self.NEGATIVE_COLOR],
+                           default=self.NEUTRAL_COLOR).tolist()
 
         bars = ax.bar(tickers_list, sentiments, color=colors, alpha=0.7, edgecolor='black')
 
-        # Add value labels on bars
-        for bar, sentiment, d in zip(bars, sentiments, data):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{sentiment:.3f}\n({d["tweets"]} tweets)',
-                   ha='center', va='bottom' if height >= 0 else 'top',
-                   fontsize=9)
+        # Add value labels on bars (above positive bars, below negative ones)
+        ax.bar_label(bars, labels=[f'{sentiment:.3f}\n({count} tweets)'
+                                   for sentiment, count in zip(sentiments, tweet_counts)],
+                     padding=3, fontsize=9)
 
         # Add horizontal line at zero
         ax.axhline(y=0, color='black', linestyle='-', linewidth=0.8)
@@ -206,10 +435,119 @@ class SentimentVisualizer:
         plt.tight_layout()
 
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            logger.info(f"Saved chart to {save_path}")
+            self._save_figure(fig, save_path, render_key)
+
+        # Free the figure right away unless it is being shown on screen
+        if SHOW_PLOTS:
+            plt.show()
+        plt.close(fig)
+
+    @staticmethod
+    def _has_output(save_path) -> bool:
+        """
+        Check that a chart would end up somewhere before drawing it.
+
+        Charts are only shown in a window with SENTIMENT_SHOW=1 (or --show),
+        so without a save_path there is nothing to do.
+
+        Args:
+            save_path: The save_path passed to a plot method
+
+        Returns:
+            True if the chart will be saved or shown, False otherwise
+        """
+        if save_path or SHOW_PLOTS:
+            return True
+        logger.warning("Chart not drawn: pass save_path, or set SENTIMENT_SHOW=1 "
+                       "to open charts in a window")
+        return False
+
+    def _save_figure(self, fig, save_path, render_key=None):
+        """
+        Save a chart to a file or a file-like object.
+
+        The format comes from the file extension (.png, .svg, .pdf, ...);
+        file objects such as io.BytesIO get PNG. SVG and PDF are vector
+        formats, so there is no pixel data to compress - handy for charts
+        embedded in web pages.
 
-        plt.show()
+        PNG files use a lower zlib compression level (3 instead of 6) and skip
+        the "Software" metadata: encoding is noticeably faster for a somewhat
+        larger file.
+
+        Args:
+            fig: Matplotlib figure to save
+            save_path: File path, or a binary file object (e.g. io.BytesIO)
+            render_key: What the chart was drawn from. If given, the encoded
+                        image is kept so _save_cached_render can reuse it.
+        """
+        fmt = self._chart_format(save_path)
+
+        options = {'format': fmt, 'dpi': 300, 'bbox_inches': 'tight'}
+        if fmt == 'png':
+            options['pil_kwargs'] = {'compress_level': 3}
+            options['metadata'] = {'Software': None}
+        elif fmt == 'svg':
+            # No creation timestamp in the file
+            options['metadata'] = {'Date': None}
+        elif fmt == 'pdf':
+            options['metadata'] = {'CreationDate': None}
+
+        # Encode once into memory, then write that out (and maybe keep it)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, **options)
+        image = buffer.getvalue()
+        self._write_chart(save_path, image)
+        logger.info(f"Saved {fmt.upper()} chart to {save_path}")
+
+        if render_key is not None:
+            self._render_cache[(render_key, fmt)] = image
+            if len(self._render_cache) > self.RENDER_CACHE_SIZE:
+                self._render_cache.popitem(last=False)  # Drop the oldest
+
+    def _save_cached_render(self, render_key, save_path) -> bool:
+        """
+        Save a previously rendered chart again, skipping matplotlib entirely.
+
+        A polling dashboard asks for the same chart over and over, but the
+        picture only changes when the numbers behind it do. render_key holds
+        those numbers, so a hit means the old image is still correct.
+
+        Args:
+            render_key: What the chart is drawn from (ticker, days, summary ...)
+            save_path: Where the chart should be saved
+
+        Returns:
+            True if the cached image was written, False if the chart must be drawn
+        """
+        # Nothing to reuse when the chart is only shown on screen
+        if not save_path or SHOW_PLOTS:
+            return False
+
+        key = (render_key, self._chart_format(save_path))
+        image = self._render_cache.get(key)
+        if image is None:
+            return False
+
+        self._render_cache.move_to_end(key)  # Mark as recently used
+        self._write_chart(save_path, image)
+        logger.info(f"Saved cached chart to {save_path}")
+        return True
+
+    @staticmethod
+    def _chart_format(save_path) -> str:
+        """Image format for a save path ('png' for file objects or no extension)."""
+        if isinstance(save_path, (str, os.PathLike)):
+            return Path(save_path).suffix.lstrip('.').lower() or 'png'
+        return 'png'
+
+    @staticmethod
+    def _write_chart(save_path, image: bytes):
+        """Write encoded image bytes to a path or a binary file object."""
+        if isinstance(save_path, (str, os.PathLike)):
+            Path(save_path).write_bytes(image)
+        else:
+            save_path.write(image)
 
     def _classify_sentiment(self, score: float) -> str:
         """
@@ -238,12 +576,21 @@ if __name__ == "__main__":
     """
     Test the visualizer with sample data.
     """
+    logging.basicConfig(level=logging.INFO)
+
     print("\n=== Testing Sentiment Visualizer ===\n")
 
     visualizer = SentimentVisualizer()
 
-    # Check if we have any data in the database
-    db = DatabaseManager()
+    # Without --show the charts are saved as PNG files instead of opened
+    if SHOW_PLOTS:
+        chart_dir = None
+    else:
+        chart_dir = Config.DATA_DIR / 'charts'
+        chart_dir.mkdir(parents=True, exist_ok=True)
+
+    def chart_path(name):
+        return str(chart_dir / name) if chart_dir else None
 
     # Try to visualize data for AAPL
     print("Attempting to create visualizations for AAPL...")
@@ -252,15 +599,19 @@ if __name__ == "__main__":
 
     # Create distribution chart
     print("Creating sentiment distribution chart...")
-    visualizer.plot_sentiment_distribution('AAPL', days=7)
+    visualizer.plot_sentiment_distribution('AAPL', days=7, save_path=chart_path('AAPL_distribution.png'))
 
     # Create gauge chart
     print("Creating sentiment gauge...")
-    visualizer.plot_sentiment_gauge('AAPL', days=7)
+    visualizer.plot_sentiment_gauge('AAPL', days=7, save_path=chart_path('AAPL_gauge.png'))
 
     # If you have multiple tickers, compare them
     print("Creating comparison chart...")
-    visualizer.plot_sentiment_comparison(['AAPL', 'TSLA', 'MSFT'], days=7)
+    visualizer.plot_sentiment_comparison(['AAPL', 'TSLA', 'MSFT'], days=7,
+                                         save_path=chart_path('comparison.png'))
+
+    if chart_dir:
+        print(f"\nCharts saved to {chart_dir} (run with --show to open them in a window)")
 
     print("\nNote: If no charts appear, make sure you've collected data first:")
     print("python src/main.py --ticker AAPL --tweets 50")
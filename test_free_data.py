@@ -17,26 +17,31 @@ print("1. SEC EDGAR - Insider Trading (Form 4)")
 print("-" * 70)
 
 sec = SECEdgarCollector()
-ticker = "AAPL"
-
-print(f"Fetching Form 4 filings for {ticker}...")
-filings = sec.get_form4_filings(ticker, count=5)
-
-if filings:
-    print(f"\n✅ Found {len(filings)} insider trading filings:\n")
-    for i, filing in enumerate(filings, 1):
-        print(f"{i}. Date: {filing['filing_date']}")
-        print(f"   Type: {filing['filing_type']}")
-        print(f"   Link: {filing.get('document_link', 'N/A')[:60]}...")
-        print()
-
-    # Analyze sentiment
-    sentiment = sec.analyze_insider_sentiment(filings)
-    print("Insider Activity Analysis:")
-    print(f"  {sentiment['description']}")
-    print(f"  Activity Score: {sentiment['score']:.2f}")
-else:
-    print("❌ No filings found")
+tickers = ["AAPL", "MSFT", "NVDA"]
+
+# One call fetches every ticker (the requests run concurrently)
+print(f"Fetching Form 4 filings for {', '.join(tickers)}...")
+all_filings = sec.get_form4_filings_many(tickers, count=5)
+
+for ticker in tickers:
+    filings = all_filings.get(ticker, [])
+    print(f"\n--- {ticker} ---")
+
+    if filings:
+        print(f"\n✅ Found {len(filings)} insider trading filings:\n")
+        for i, filing in enumerate(filings, 1):
+            print(f"{i}. Date: {filing['filing_date']}")
+            print(f"   Type: {filing['filing_type']}")
+            print(f"   Link: {filing.get('document_link', 'N/A')[:60]}...")
+            print()
+
+        # Analyze sentiment
+        sentiment = sec.analyze_insider_sentiment(filings)
+        print("Insider Activity Analysis:")
+        print(f"  {sentiment['description']}")
+        print(f"  Activity Score: {sentiment['score']:.2f}")
+    else:
+        print("❌ No filings found")
 
 print("\n" + "="*70)
 print("SUMMARY")
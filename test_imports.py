@@ -4,34 +4,48 @@ Run this to diagnose import issues.
 """
 
 import sys
+from importlib import import_module
+from importlib.util import find_spec
+
+# By default only check that each package is installed (fast, runs no
+# package code). Pass --import to actually import them, which also catches
+# packages that are installed but broken.
+FULL_IMPORT = '--import' in sys.argv
+
 print(f"Python executable: {sys.executable}")
 print(f"Python version: {sys.version}")
 print(f"Python path: {sys.path}\n")
 
-print("Testing imports...")
+print("Importing packages..." if FULL_IMPORT else "Checking installed packages...")
 print("-" * 60)
 
-# Test each import
+# Package name -> module to look for
 imports = [
-    ("dotenv", "from dotenv import load_dotenv"),
-    ("requests", "import requests"),
-    ("tweepy", "import tweepy"),
-    ("textblob", "from textblob import TextBlob"),
-    ("vaderSentiment", "from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer"),
-    ("beautifulsoup4", "from bs4 import BeautifulSoup"),
-    ("pytz", "import pytz"),
-    ("dateutil", "from dateutil import parser"),
+    ("dotenv", "dotenv"),
+    ("requests", "requests"),
+    ("tweepy", "tweepy"),
+    ("textblob", "textblob"),
+    ("vaderSentiment", "vaderSentiment.vaderSentiment"),
+    ("beautifulsoup4", "bs4"),
+    ("pytz", "pytz"),
+    ("dateutil", "dateutil.parser"),
 ]
 
 failed = []
-for name, import_statement in imports:
+lines = []  # Result lines, written out together after the loop
+for name, module in imports:
     try:
-        exec(import_statement)
-        print(f"✓ {name:20s} - OK")
+        if FULL_IMPORT:
+            import_module(module)
+        # find_spec only looks for the top-level package on disk
+        elif find_spec(module.partition('.')[0]) is None:
+            raise ImportError(f"No module named '{module}'")
+        lines.append(f"✓ {name:20s} - OK")
     except ImportError as e:
-        print(f"✗ {name:20s} - FAILED: {e}")
+        lines.append(f"✗ {name:20s} - FAILED: {e}")
         failed.append(name)
 
+sys.stdout.write('\n'.join(lines) + '\n')
 print("-" * 60)
 if failed:
     print(f"\n❌ {len(failed)} package(s) failed to import:")
@@ -40,6 +54,6 @@ if failed:
     print("\nTo install missing packages, run:")
     print("   pip install python-dotenv requests tweepy textblob vaderSentiment beautifulsoup4 pytz python-dateutil")
 else:
-    print("\n✓ All packages imported successfully!")
+    print("\n✓ All packages imported successfully!" if FULL_IMPORT else "\n✓ All packages are installed!")
     print("\nYou can now run:")
     print("   python src/main.py --ticker AAPL --tweets 10")